@@ -31,6 +31,30 @@ Tagged
 CustomDict
     Custom dictionary for Korean.
     `from baikalnlpy import CustomDict`
+DictIndex
+    Local multi-pattern index over custom dictionary entries.
+    `from baikalnlpy import DictIndex`
+CorpusStats
+    Streaming corpus statistics over tagged results.
+    `from baikalnlpy import CorpusStats`
+MorphemeVectorizer
+    Sparse bag-of-morphemes features from tagged results.
+    `from baikalnlpy import MorphemeVectorizer`
+IncrementalTagger
+    Re-tags only changed sentences of an edited document.
+    `from baikalnlpy import IncrementalTagger`
+TaggingProxy
+    Local caching proxy for remote baikal NLP servers, `baikalnlpy sidecar`.
+    `from baikalnlpy import TaggingProxy`
+RequestScheduler
+    Priority-aware scheduler for Tagger requests.
+    `from baikalnlpy import RequestScheduler`
+RecordingChannel, ReplayChannel
+    Record and replay transport for offline tests and benchmarks.
+    `from baikalnlpy import RecordingChannel, ReplayChannel`
+DomainRouter
+    Domain-affinity routing of Tagger requests across several servers.
+    `from baikalnlpy import DomainRouter`
 
 Version
 -------
@@ -51,8 +75,18 @@ import os
 
 from baikalnlpy._tagger import Tagger, Tagged
 from baikalnlpy._custom_dict import CustomDict
+from baikalnlpy._dict_index import DictIndex, DictEntry, DictMatch
 from baikalnlpy._custom_dict_client import CustomDictionaryServiceClient
 from baikalnlpy._lang_service_client import BaikalLanguageServiceClient
+from baikalnlpy._tag_set import NOUNS, VERBS, PREDICATES, PARTICLES, ENDINGS, SYMBOLS, tag_mask
+from baikalnlpy._corpus_stats import CorpusStats, HeavyHitters
+from baikalnlpy._featurizer import MorphemeVectorizer
+from baikalnlpy._batch_control import AdaptiveBatchController
+from baikalnlpy._incremental import IncrementalTagger
+from baikalnlpy._sidecar import TaggingProxy
+from baikalnlpy._scheduler import RequestScheduler, QueueTimeout
+from baikalnlpy._transport import RecordingChannel, ReplayChannel, ReplayError
+from baikalnlpy._routing import DomainRouter
 
 version = "1.0"
 baikal_nlp_version = "1.7.3"
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+baikalnlpy command line tools.
+
+  python -m baikalnlpy sidecar --upstream nlp1:5656 --upstream nlp2:5656 --port 5656
+  python -m baikalnlpy loadtest --corpus corpus.txt --endpoint nlp1:5656 --concurrency 8
+"""
+import argparse
+import json
+import sys
+
+
+def _sidecar(args):
+    from baikalnlpy._sidecar import TaggingProxy, serve
+    proxy = TaggingProxy(args.upstream,
+                         cache_bytes=args.cache_mb * 1024 * 1024,
+                         pool_size=args.pool_size)
+    server = serve(proxy, args.port, args.host, args.workers)
+    print(f'baikalnlpy sidecar listening on {args.host}:{server.bound_port}, '
+          f'upstreams: {", ".join(proxy.upstreams)}', file=sys.stderr)
+    server.wait_for_termination()
+
+
+def _loadtest(args):
+    from baikalnlpy._loadtest import LoadTest, start_stand_in
+    endpoints = list(args.endpoint or [])
+    stand_in = None
+    if args.stand_in:
+        stand_in = start_stand_in(latency=args.stand_in_latency)
+        endpoints.append(f'localhost:{stand_in.bound_port}')
+    if not endpoints:
+        print('no endpoint, use --endpoint or --stand-in', file=sys.stderr)
+        sys.exit(2)
+    with open(args.corpus, 'r', encoding='utf-8') as f:
+        corpus = f.read().splitlines()
+    try:
+        report = LoadTest(endpoints, corpus,
+                          concurrency=args.concurrency,
+                          size=args.size,
+                          domain=args.domain,
+                          auto_split=args.auto_split,
+                          mode=args.mode,
+                          rate=args.rate,
+                          duration=args.duration,
+                          requests=args.requests,
+                          timeout=args.timeout,
+                          seed=args.seed).run()
+    finally:
+        if stand_in is not None:
+            stand_in.stop(None)
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='baikalnlpy')
+    sub = parser.add_subparsers(dest='command')
+    sub.required = True
+
+    p = sub.add_parser('sidecar', help='local caching proxy for baikal NLP servers')
+    p.add_argument('--upstream', action='append', required=True,
+                   help='baikal NLP server, host:port. repeat for several servers.')
+    p.add_argument('--host', default='localhost',
+                   help='listen address. the sidecar has no authentication and forwards custom dict '
+                        'updates, so only use a wider address such as [::] on a trusted network.')
+    p.add_argument('--port', type=int, default=5656, help='listen port')
+    p.add_argument('--cache-mb', type=int, default=256, help='result cache size in MB')
+    p.add_argument('--pool-size', type=int, default=2, help='connections per upstream')
+    p.add_argument('--workers', type=int, default=32, help='request handler threads')
+    p.set_defaults(func=_sidecar)
+
+    p = sub.add_parser('loadtest', help='measure throughput and latency of baikal NLP servers')
+    p.add_argument('--corpus', required=True, help='text file, one sentence per line')
+    p.add_argument('--endpoint', action='append', help='host:port. repeat for several servers.')
+    p.add_argument('--stand-in', action='store_true', help='also start a local stand-in server and use it')
+    p.add_argument('--stand-in-latency', type=float, default=0.0, help='stand-in latency per request, seconds')
+    p.add_argument('--concurrency', type=int, default=4, help='in-flight requests')
+    p.add_argument('--size', default='fixed:1', help='lines per request, fixed:N or uniform:A:B')
+    p.add_argument('--domain', default='', help='custom dict domain')
+    p.add_argument('--auto-split', action='store_true', help='split sentences on the server')
+    p.add_argument('--mode', choices=['closed', 'open'], default='closed',
+                   help='closed loop, or open loop with a fixed arrival rate')
+    p.add_argument('--rate', type=float, default=10.0, help='requests per second in open mode')
+    p.add_argument('--duration', type=float, default=10.0, help='seconds')
+    p.add_argument('--requests', type=int, default=0, help='stop after this many requests')
+    p.add_argument('--timeout', type=float, default=None, help='per request timeout, seconds')
+    p.add_argument('--seed', type=int, default=None, help='random seed')
+    p.set_defaults(func=_loadtest)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
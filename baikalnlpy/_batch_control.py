@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from typing import Dict
+
+import grpc
+
+from baikalnlpy._lang_service_client import MAX_MESSAGE_LENGTH
+
+RETRYABLE_CODES = frozenset([
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.UNAVAILABLE,
+])
+
+
+class AdaptiveBatchController:
+    """
+    대량 형태소 분석의 배치 크기와 동시 요청 수를 AIMD 방식으로 조절합니다.
+
+    응답 지연이 목표 이하이면 배치 크기를 조금씩 늘리고, 동시 요청 수만큼의
+    성공이 모이면 동시 요청 수를 하나 늘립니다(additive increase).
+    지연이 목표를 넘으면 배치 크기를, 오류가 나면 배치 크기와 동시 요청 수를
+    모두 일정 비율로 줄입니다(multiplicative decrease).
+    `Tagger.bulk_tags()` 가 사용하며, 여러 쓰레드에서 안전하게 호출할 수 있습니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> tagger = bn.Tagger()
+        >>> ctl = bn.AdaptiveBatchController(target_latency=0.5)
+        >>> for tagged in tagger.bulk_tags(open('corpus.txt'), controller=ctl):
+        ...     print(ctl.settings())
+    """
+
+    def __init__(self,
+                 batch_bytes: int = 64 * 1024,
+                 min_batch_bytes: int = 1024,
+                 max_batch_bytes: int = MAX_MESSAGE_LENGTH // 16,
+                 concurrency: int = 2,
+                 min_concurrency: int = 1,
+                 max_concurrency: int = 16,
+                 target_latency: float = 1.0,
+                 increase_bytes: int = 16 * 1024,
+                 decrease_factor: float = 0.5,
+                 timeout: float = None,
+                 max_retries: int = 3):
+        """
+        Args:
+            batch_bytes (int, optional): 처음 배치 크기(UTF-8 바이트)
+            min_batch_bytes (int, optional): 최소 배치 크기
+            max_batch_bytes (int, optional): 최대 배치 크기, 응답이 요청보다 크므로
+                `MAX_MESSAGE_LENGTH` 보다 충분히 작게 잡습니다.
+            concurrency (int, optional): 처음 동시 요청 수
+            min_concurrency (int, optional): 최소 동시 요청 수
+            max_concurrency (int, optional): 최대 동시 요청 수
+            target_latency (float, optional): 목표 응답 지연(초)
+            increase_bytes (int, optional): 성공할 때마다 늘리는 배치 크기
+            decrease_factor (float, optional): 줄일 때 곱하는 비율
+            timeout (float, optional): 요청마다 적용할 제한 시간(초)
+            max_retries (int, optional): 한 배치의 최대 재시도 횟수
+        Raises:
+            ValueError: 범위가 잘못되면 에러를 발생시킵니다.
+        """
+        if not 0 < min_batch_bytes <= max_batch_bytes:
+            raise ValueError("invalid batch bytes range.")
+        if not 0 < min_concurrency <= max_concurrency:
+            raise ValueError("invalid concurrency range.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+        self.min_batch_bytes = min_batch_bytes
+        self.max_batch_bytes = max_batch_bytes
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.increase_bytes = increase_bytes
+        self.decrease_factor = decrease_factor
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._batch_bytes = min(max(batch_bytes, min_batch_bytes), max_batch_bytes)
+        self._concurrency = min(max(concurrency, min_concurrency), max_concurrency)
+        self._streak = 0
+        self._started = None
+        self._chars = 0
+        self._requests = 0
+        self._failures = 0
+        self._latency = 0.0
+
+    @property
+    def batch_bytes(self) -> int:
+        """현재 배치 크기(바이트)"""
+        return self._batch_bytes
+
+    @property
+    def concurrency(self) -> int:
+        """현재 동시 요청 수"""
+        return self._concurrency
+
+    def begin(self):
+        """처리량 측정을 시작합니다. 처음 요청을 보낼 때 한 번 부르면 됩니다."""
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+
+    def record_success(self, chars: int, latency: float):
+        """
+        성공한 요청을 반영합니다.
+
+        Args:
+            chars (int): 요청한 글자 수
+            latency (float): 응답 지연(초)
+        """
+        with self._lock:
+            self._requests += 1
+            self._chars += chars
+            self._latency = latency if self._requests == 1 else 0.8 * self._latency + 0.2 * latency
+            if latency <= self.target_latency:
+                self._batch_bytes = min(self._batch_bytes + self.increase_bytes, self.max_batch_bytes)
+                self._streak += 1
+                if self._streak >= self._concurrency:
+                    self._streak = 0
+                    self._concurrency = min(self._concurrency + 1, self.max_concurrency)
+            else:
+                self._streak = 0
+                self._batch_bytes = max(int(self._batch_bytes * self.decrease_factor), self.min_batch_bytes)
+
+    def record_failure(self, code: grpc.StatusCode = None):
+        """
+        실패한 요청을 반영합니다.
+
+        Args:
+            code (grpc.StatusCode, optional): 실패한 요청의 상태 코드
+        """
+        with self._lock:
+            self._failures += 1
+            self._streak = 0
+            self._batch_bytes = max(int(self._batch_bytes * self.decrease_factor), self.min_batch_bytes)
+            self._concurrency = max(int(self._concurrency * self.decrease_factor), self.min_concurrency)
+
+    def throughput(self) -> float:
+        """
+        측정을 시작한 뒤 성공한 요청의 초당 글자 수를 돌려줍니다.
+        """
+        with self._lock:
+            if self._started is None:
+                return 0.0
+            elapsed = time.monotonic() - self._started
+            return self._chars / elapsed if elapsed > 0 else 0.0
+
+    def settings(self) -> Dict:
+        """
+        현재 설정과 측정값을 돌려줍니다.
+
+        Returns:
+            Dict: batch_bytes, concurrency, latency(지연의 지수 이동 평균),
+                throughput(초당 글자 수), requests, failures
+        """
+        throughput = self.throughput()
+        with self._lock:
+            return {
+                'batch_bytes': self._batch_bytes,
+                'concurrency': self._concurrency,
+                'latency': self._latency,
+                'throughput': throughput,
+                'requests': self._requests,
+                'failures': self._failures,
+            }
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, Iterable, List, Tuple, Union
+
+from baikal.language.language_service_pb2 import AnalyzeSyntaxResponse, Morpheme
+
+from baikalnlpy._tagger import Tagged
+from baikalnlpy._tag_set import TAG_NAMES, OOV_NAMES, NOUNS, VERBS, mask_table
+
+
+class HeavyHitters:
+    """
+    제한된 메모리로 빈도가 높은 항목을 추정하는 Misra-Gries 요약.
+
+    항목의 개수가 capacity 를 넘으면 모든 카운터를 최소값만큼 줄이고
+    0이 된 항목을 버립니다. 남은 카운트는 실제 빈도보다 작거나 같고,
+    그 오차는 최대 `error` 입니다. 두 요약은 `merge` 로 합칠 수 있으며
+    합친 결과도 같은 오차 보장을 가집니다.
+    """
+
+    def __init__(self, capacity: int = 100000):
+        """
+        Args:
+            capacity (int, optional): 유지할 카운터의 최대 개수
+        Raises:
+            ValueError: capacity 가 1보다 작으면 에러를 발생시킵니다.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        self.capacity = capacity
+        self.counters = {}
+        self.total = 0
+        self.error = 0
+
+    def add(self, key: str, count: int = 1):
+        """
+        항목의 빈도를 더합니다.
+
+        Args:
+            key (str): 항목
+            count (int, optional): 더할 빈도
+        """
+        self.total += count
+        counters = self.counters
+        if key in counters:
+            counters[key] += count
+            return
+        counters[key] = count
+        if len(counters) > self.capacity:
+            self._trim()
+
+    def _trim(self):
+        # capacity + 1 번째로 큰 값만큼 모두 줄이면 capacity 개 이하만 남는다.
+        counts = sorted(self.counters.values(), reverse=True)
+        cut = counts[self.capacity]
+        self.error += cut
+        self.counters = {k: c - cut for k, c in self.counters.items() if c > cut}
+
+    def merge(self, other: 'HeavyHitters') -> 'HeavyHitters':
+        """
+        다른 요약을 합칩니다.
+
+        Args:
+            other (HeavyHitters): 합칠 요약
+
+        Returns:
+            HeavyHitters: 자기 자신
+        """
+        counters = self.counters
+        for k, c in other.counters.items():
+            counters[k] = counters.get(k, 0) + c
+        self.total += other.total
+        self.error += other.error
+        if len(counters) > self.capacity:
+            self._trim()
+        return self
+
+    def most_common(self, n: int = None) -> List[Tuple[str, int]]:
+        """
+        빈도가 높은 항목을 돌려줍니다.
+
+        Args:
+            n (int, optional): 돌려줄 개수, 지정하지 않으면 모두 돌려줍니다.
+
+        Returns:
+            List[Tuple[str, int]]: (항목, 추정 빈도)의 목록
+        """
+        items = sorted(self.counters.items(), key=lambda kv: kv[1], reverse=True)
+        return items if n is None else items[:n]
+
+    def __getitem__(self, key: str) -> int:
+        return self.counters.get(key, 0)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.counters
+
+    def __len__(self) -> int:
+        return len(self.counters)
+
+
+class CorpusStats:
+    """
+    형태소 분석 결과를 흘려보내면서 말뭉치 통계를 누적합니다.
+
+    품사와 미등록어 종류는 태그 번호로 색인된 배열에 세기 때문에
+    중간 목록을 만들지 않습니다. 명사와 동사의 어휘 빈도는 `HeavyHitters` 로
+    메모리를 제한합니다. 여러 작업자의 결과는 `merge` 로 합칠 수 있습니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> tagger = bn.Tagger()
+        >>> stats = bn.CorpusStats()
+        >>> for line in open('corpus.txt'):
+        ...     stats.add(tagger.tag(line))
+        >>> stats.nouns.most_common(10)
+        >>> stats.oov_rate()
+    """
+
+    def __init__(self, capacity: int = 100000):
+        """
+        Args:
+            capacity (int, optional): 명사, 동사 요약마다 유지할 어휘의 최대 개수
+        """
+        self.sentences = 0
+        self.tokens = 0
+        self.morphemes = 0
+        self.tag_counts = [0] * len(TAG_NAMES)
+        self.oov_counts = [0] * len(OOV_NAMES)
+        self.probability_sum = 0.0
+        self.nouns = HeavyHitters(capacity)
+        self.verbs = HeavyHitters(capacity)
+
+    def add(self, tagged: Union[Tagged, AnalyzeSyntaxResponse]):
+        """
+        형태소 분석 결과 하나를 누적합니다.
+
+        Args:
+            tagged (Union[Tagged, AnalyzeSyntaxResponse]): 형태소 분석 결과
+        """
+        res = tagged.msg() if isinstance(tagged, Tagged) else tagged
+        tag_counts = self.tag_counts
+        oov_counts = self.oov_counts
+        add_noun = self.nouns.add
+        add_verb = self.verbs.add
+        is_noun = mask_table(NOUNS)
+        is_verb = mask_table(VERBS)
+        tokens = 0
+        morphemes = 0
+        prob = 0.0
+        for s in res.sentences:
+            tokens += len(s.tokens)
+            for token in s.tokens:
+                for m in token.morphemes:
+                    tag = m.tag
+                    tag_counts[tag] += 1
+                    oov_counts[m.out_of_vocab] += 1
+                    prob += m.probability
+                    morphemes += 1
+                    if is_noun[tag]:
+                        add_noun(m.text.content)
+                    elif is_verb[tag]:
+                        add_verb(m.text.content)
+        self.sentences += len(res.sentences)
+        self.tokens += tokens
+        self.morphemes += morphemes
+        self.probability_sum += prob
+
+    def update(self, results: Iterable[Union[Tagged, AnalyzeSyntaxResponse]]) -> 'CorpusStats':
+        """
+        여러 형태소 분석 결과를 누적합니다.
+
+        Args:
+            results (Iterable): 형태소 분석 결과들
+
+        Returns:
+            CorpusStats: 자기 자신
+        """
+        for r in results:
+            self.add(r)
+        return self
+
+    def merge(self, other: 'CorpusStats') -> 'CorpusStats':
+        """
+        다른 작업자가 만든 부분 통계를 합칩니다.
+
+        Args:
+            other (CorpusStats): 합칠 통계
+
+        Returns:
+            CorpusStats: 자기 자신
+        """
+        self.sentences += other.sentences
+        self.tokens += other.tokens
+        self.morphemes += other.morphemes
+        self.probability_sum += other.probability_sum
+        self.tag_counts = [a + b for a, b in zip(self.tag_counts, other.tag_counts)]
+        self.oov_counts = [a + b for a, b in zip(self.oov_counts, other.oov_counts)]
+        self.nouns.merge(other.nouns)
+        self.verbs.merge(other.verbs)
+        return self
+
+    def pos_distribution(self) -> Dict[str, float]:
+        """
+        품사별 형태소 비율을 돌려줍니다.
+
+        Returns:
+            Dict[str, float]: 품사 이름과 비율, 나타나지 않은 품사는 빠집니다.
+        """
+        if self.morphemes == 0:
+            return {}
+        return {TAG_NAMES[i]: c / self.morphemes
+                for i, c in enumerate(self.tag_counts) if c > 0}
+
+    def oov_distribution(self) -> Dict[str, int]:
+        """
+        어휘 출처(OutOfVocab)별 형태소 개수를 돌려줍니다.
+
+        Returns:
+            Dict[str, int]: 어휘 출처 이름과 개수
+        """
+        return {OOV_NAMES[i]: c
+                for i, c in enumerate(self.oov_counts) if c > 0}
+
+    def oov_rate(self) -> float:
+        """
+        미등록어(OUT_OF_VOCAB) 형태소의 비율을 돌려줍니다.
+        """
+        if self.morphemes == 0:
+            return 0.0
+        return self.oov_counts[Morpheme.OutOfVocab.OUT_OF_VOCAB] / self.morphemes
+
+    def mean_probability(self) -> float:
+        """
+        형태소 확률의 평균을 돌려줍니다.
+        """
+        if self.morphemes == 0:
+            return 0.0
+        return self.probability_sum / self.morphemes
@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 
 from typing import List
+
+import grpc
+
 from ._custom_dict_client import CustomDictionaryServiceClient
+from ._dict_index import DictIndex
+from ._routing import FAILOVER_CODES
 from baikal.language.custom_dict_pb2 import CustomDictionary
 from baikal.language.dict_common_pb2 import DictSet
 
@@ -67,7 +72,8 @@ class CustomDict():
         >>> # cd2.save(dir="my_dir")
     """
 
-    def __init__(self, domain: str, host: str = "", port: int = 5656):
+    def __init__(self, domain: str, host: str = "", port: int = 5656, channel=None,
+                 remotes: List[str] = None):
         """
         사용자 사전 래퍼(wrapper)의 생성자
 
@@ -77,6 +83,9 @@ class CustomDict():
                 지정하지 않으면 기본값으로 사용합니다.
             port (int, optional): 사용자 사전 관리를 수행할 바이칼 NLP 서버의 포트번호,
                 지정하지 않으면 5656 포트를 사용합니다.
+            channel (grpc.Channel, optional): 지정하면 host, port 대신 이 채널을 사용합니다.
+            remotes (List[str], optional): 이 사전을 맡은 서버 주소들, 호스트이름:포트 형식.
+                지정하면 host, port 대신 사용하고, 갱신과 삭제는 모든 서버로 보냅니다.
         Raises:
             ValueError: 사용자 사전의 이름이 없으면 에러를 발생시킵니다.
         """
@@ -91,7 +100,11 @@ class CustomDict():
         if domain is None:
             raise ValueError("domain name must be specified.")
 
-        self.stub = CustomDictionaryServiceClient(addr)
+        if remotes:
+            self.stubs = [CustomDictionaryServiceClient(remote) for remote in remotes]
+        else:
+            self.stubs = [CustomDictionaryServiceClient(addr, channel)]
+        self.stub = self.stubs[0]
         self.cp_set = set()
         self.np_set = set()
         self.cp_caret_set = set()
@@ -156,20 +169,42 @@ class CustomDict():
         """
         self.cp_caret_set = dict_set
 
+    def build_index(self) -> DictIndex:
+        """
+        현재 설정된 사전으로 Aho-Corasick 색인을 만듭니다.
+        서버를 부르지 않고 문장에서 사전 항목을 찾을 수 있습니다.
+
+        Returns:
+            DictIndex: 고유명사, 복합명사, 복합명사 분리 사전의 색인
+        """
+        return DictIndex.from_dicts([self])
+
+    def _read(self, fn):
+        """서버에 닿지 않으면 사전을 맡은 다음 서버로 넘어갑니다."""
+        for stub in self.stubs[:-1]:
+            try:
+                return fn(stub)
+            except grpc.RpcError as e:
+                if e.code() not in FAILOVER_CODES:
+                    raise
+        return fn(self.stubs[-1])
+
     def update(self) -> bool:
         """
         복합명사 사전을 바이칼 NLP 서버에 갱신합니다.
+        사전을 맡은 서버가 여럿이면 모두 갱신합니다.
 
         Raises:
             e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
 
         Returns:
-            bool: 갱신이 성공하면 참을 돌려줍니다.
+            bool: 모든 서버에서 갱신이 성공하면 참을 돌려줍니다.
         """
-        return self.stub.update(self.domain,
-                                self.np_set,
-                                self.cp_set,
-                                self.cp_caret_set)
+        results = [stub.update(self.domain,
+                               self.np_set,
+                               self.cp_set,
+                               self.cp_caret_set) for stub in self.stubs]
+        return all(results)
 
     def get(self) -> CustomDictionary:
         """
@@ -182,7 +217,7 @@ class CustomDict():
         Returns:
             pb.CustomDictionary: 사용자 사전 데이터 전체를 담고 있는 protobuf 메시지
         """
-        return self.stub.get(self.domain)
+        return self._read(lambda stub: stub.get(self.domain))
 
 
     def load(self):
@@ -190,7 +225,7 @@ class CustomDict():
         서버에 저정되어 있는 사용자 사전을 모두 가져옵니다.
         """
         try:
-            d = self.stub.get(self.domain)
+            d = self._read(lambda stub: stub.get(self.domain))
             self.np_set = pb_map_to_set(d.np_set)
             self.cp_caret_set = pb_map_to_set(d.cp_caret_set)
             self.cp_set = pb_map_to_set(d.cp_set)
@@ -201,6 +236,7 @@ class CustomDict():
     def clear(self) -> List[str]:
         """
         사용자 사전의 내용을 삭제합니다.
+        사전을 맡은 서버가 여럿이면 모두에서 삭제합니다.
 
         Raises:
             e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
@@ -212,4 +248,5 @@ class CustomDict():
         self.np_set.clear()
         self.cp_set.clear()
         self.cp_caret_set.clear()
-        return self.stub.remove([self.domain])
+        removed = [stub.remove([self.domain]) for stub in self.stubs]
+        return removed[0]
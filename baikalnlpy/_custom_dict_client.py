@@ -39,20 +39,24 @@ class CustomDictionaryServiceClient:
     The custom dictionary client which can create, update, list, delete your own one.
     """
 
-    def __init__(self, remote: str):
+    def __init__(self, remote: str, channel: grpc.Channel = None):
         """사용자 사전을 관리하는 클라이언트 객체 생성자
 
         Args:
             remote (str): 원격 주소, IP주소:포트 또는 호스트이름:포트 형식으로 사용합니다.
+            channel (grpc.Channel, optional): 지정하면 remote 대신 이 채널을 사용합니다.
+                `RecordingChannel`, `ReplayChannel` 을 넘길 수 있습니다.
         """
         super().__init__()
-        channel = grpc.insecure_channel(remote,
-                                        options=[
-                                            ('grpc.max_send_message_length',
-                                             MAX_MESSAGE_LENGTH),
-                                            ('grpc.max_receive_message_length',
-                                             MAX_MESSAGE_LENGTH),
-                                        ])
+        if channel is None:
+            channel = grpc.insecure_channel(remote,
+                                            options=[
+                                                ('grpc.max_send_message_length',
+                                                 MAX_MESSAGE_LENGTH),
+                                                ('grpc.max_receive_message_length',
+                                                 MAX_MESSAGE_LENGTH),
+                                            ])
+        self.channel = channel
         self.stub = cds.CustomDictionaryServiceStub(channel)
 
 
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+DICT_KINDS = ('np', 'cp', 'cp_caret')
+
+
+class DictEntry(NamedTuple):
+    """사전 항목, cp_caret 항목의 word 는 '^' 가 들어있는 원래 항목입니다."""
+    domain: str
+    kind: str
+    word: str
+
+
+class DictMatch(NamedTuple):
+    """문장에서 찾은 사전 항목과 그 위치"""
+    start: int
+    end: int
+    entry: DictEntry
+
+
+class DictIndex:
+    """
+    사용자 사전 항목들을 Aho-Corasick 오토마톤으로 묶은 색인.
+
+    서버를 부르지 않고 문장을 한 번 훑어서 모든 사전 항목의 출현 위치를 찾습니다.
+    cp_caret 항목은 '^' 를 뺀 글자로 찾습니다. 여러 도메인의 사전을 함께 넣으면
+    도메인별 적중 수로 문장을 보낼 도메인을 고를 수 있고, 훑은 문장들에서
+    항목별 적중 수를 모아 사전의 쓰임새를 점검할 수 있습니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> tagger = bn.Tagger()
+        >>> index = bn.DictIndex()
+        >>> for domain in ['law', 'medical']:
+        ...     cd = tagger.custom_dict(domain)
+        ...     cd.load()
+        ...     index.add_dict(cd)
+        >>> index.route('근저당권 설정 등기를 신청했다.')
+        'law'
+        >>> index.coverage()
+    """
+
+    def __init__(self):
+        self._patterns: Dict[str, int] = {}
+        self._entries: List[List[DictEntry]] = []
+        self._lengths: List[int] = []
+        self.entry_hits: List[int] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminal: List[int] = [-1]
+        self._out: List[List[int]] = [[]]
+        self._built = True
+
+    def add(self, word: str, domain: str = '', kind: str = 'np'):
+        """
+        항목 하나를 더합니다. 다음 검색 때 오토마톤을 다시 만듭니다.
+
+        Args:
+            word (str): 사전 항목, cp_caret 항목은 '^' 를 포함한 원래 형태
+            domain (str, optional): 사용자 사전의 이름
+            kind (str, optional): 'np', 'cp', 'cp_caret' 중 하나
+        Raises:
+            ValueError: 알 수 없는 사전 종류이면 에러를 발생시킵니다.
+        """
+        if kind not in DICT_KINDS:
+            raise ValueError(f"kind must be one of {DICT_KINDS}.")
+        surface = word.replace('^', '') if kind == 'cp_caret' else word
+        if not surface:
+            return
+        pid = self._patterns.get(surface)
+        if pid is None:
+            pid = len(self._entries)
+            self._patterns[surface] = pid
+            self._entries.append([])
+            self._lengths.append(len(surface))
+            self.entry_hits.append(0)
+            self._insert(surface, pid)
+        entries = self._entries[pid]
+        entry = DictEntry(domain, kind, word)
+        if entry not in entries:
+            entries.append(entry)
+        self._built = False
+
+    def add_dict(self, cd) -> 'DictIndex':
+        """
+        사용자 사전의 np, cp, cp_caret 항목을 모두 더합니다.
+
+        Args:
+            cd (CustomDict): 사용자 사전
+
+        Returns:
+            DictIndex: 자기 자신
+        """
+        for kind, words in (('np', cd.np_set), ('cp', cd.cp_set), ('cp_caret', cd.cp_caret_set)):
+            for w in words:
+                self.add(w, cd.domain, kind)
+        return self
+
+    def _insert(self, surface: str, pid: int):
+        goto = self._goto
+        state = 0
+        for ch in surface:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][ch] = nxt
+                goto.append({})
+                self._terminal.append(-1)
+            state = nxt
+        self._terminal[state] = pid
+
+    def build(self):
+        """
+        실패 함수와 출력 목록을 계산합니다. 검색할 때 필요하면 저절로 부릅니다.
+        """
+        goto = self._goto
+        fail = [0] * len(goto)
+        out = [[pid] if pid >= 0 else [] for pid in self._terminal]
+        queue = deque()
+        for nxt in goto[0].values():
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+        self._fail = fail
+        self._out = out
+        self._built = True
+
+    def finditer(self, text: str) -> Iterator[DictMatch]:
+        """
+        문장에서 사전 항목을 모두 찾습니다. 겹치는 항목도 모두 돌려줍니다.
+        항목별 적중 수(`entry_hits`)도 함께 셉니다.
+
+        Args:
+            text (str): 문장
+
+        Returns:
+            Iterator[DictMatch]: 찾은 항목들, 끝 위치 순서
+        """
+        if not self._built:
+            self.build()
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self._lengths
+        entries = self._entries
+        hits = self.entry_hits
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for pid in out[state]:
+                    hits[pid] += 1
+                    start = end - lengths[pid]
+                    for e in entries[pid]:
+                        yield DictMatch(start, end, e)
+
+    def scan(self, text: str) -> List[DictMatch]:
+        """
+        문장에서 사전 항목을 모두 찾아 목록으로 돌려줍니다.
+
+        Args:
+            text (str): 문장
+
+        Returns:
+            List[DictMatch]: 찾은 항목들
+        """
+        return list(self.finditer(text))
+
+    def domain_hits(self, text: str) -> Dict[str, int]:
+        """
+        도메인별로 찾은 항목의 수를 돌려줍니다.
+
+        Args:
+            text (str): 문장
+
+        Returns:
+            Dict[str, int]: 도메인 이름과 적중 수
+        """
+        ret = {}
+        for m in self.finditer(text):
+            d = m.entry.domain
+            ret[d] = ret.get(d, 0) + 1
+        return ret
+
+    def route(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        적중한 항목이 가장 많은 도메인을 돌려줍니다.
+
+        Args:
+            text (str): 문장
+            default (str, optional): 적중한 항목이 없을 때 돌려줄 값
+
+        Returns:
+            str: 도메인 이름
+        """
+        hits = self.domain_hits(text)
+        if not hits:
+            return default
+        return max(hits.items(), key=lambda kv: kv[1])[0]
+
+    def coverage(self) -> Dict[str, Dict[str, float]]:
+        """
+        지금까지 훑은 문장들에 대한 도메인별 사전 적중 통계를 돌려줍니다.
+
+        Returns:
+            Dict: 도메인마다 entries(항목 수), used(한 번 이상 나온 항목 수),
+                hits(전체 적중 수), ratio(used / entries)
+        """
+        ret = {}
+        for pid, entries in enumerate(self._entries):
+            n = self.entry_hits[pid]
+            for e in entries:
+                c = ret.setdefault(e.domain, {'entries': 0, 'used': 0, 'hits': 0})
+                c['entries'] += 1
+                c['hits'] += n
+                if n:
+                    c['used'] += 1
+        for c in ret.values():
+            c['ratio'] = c['used'] / c['entries']
+        return ret
+
+    def unused(self, domain: str = None) -> List[DictEntry]:
+        """
+        지금까지 한 번도 나오지 않은 항목을 돌려줍니다.
+
+        Args:
+            domain (str, optional): 지정하면 그 도메인의 항목만 돌려줍니다.
+
+        Returns:
+            List[DictEntry]: 나오지 않은 항목들
+        """
+        return [e for pid, entries in enumerate(self._entries) if not self.entry_hits[pid]
+                for e in entries if domain is None or e.domain == domain]
+
+    def reset_hits(self):
+        """항목별 적중 수를 지웁니다."""
+        self.entry_hits = [0] * len(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def from_dicts(dicts: Iterable) -> 'DictIndex':
+        """
+        여러 사용자 사전으로 색인을 만듭니다.
+
+        Args:
+            dicts (Iterable[CustomDict]): 사용자 사전들
+
+        Returns:
+            DictIndex: 만든 색인
+        """
+        index = DictIndex()
+        for cd in dicts:
+            index.add_dict(cd)
+        index.build()
+        return index
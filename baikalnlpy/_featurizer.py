@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+import zlib
+from array import array
+from typing import Iterable, Iterator, Tuple, Union
+
+from baikal.language.language_service_pb2 import AnalyzeSyntaxResponse
+
+from baikalnlpy._tagger import Tagged
+from baikalnlpy._tag_set import ALL_TAGS, tag_mask, mask_table
+
+UNITS = ('morph', 'morph_tag', 'lemma')
+
+_HASH_MULT = 1000003
+
+
+class MorphemeVectorizer:
+    """
+    형태소 분석 결과를 희소 행렬(CSR)로 바꾸는 특징 추출기.
+
+    결과 하나(`Tagged` 또는 `AnalyzeSyntaxResponse`)가 한 행이 됩니다.
+    단위(unit)는 형태소('morph'), 형태소와 품사('morph_tag'), 어절의 원형('lemma')
+    가운데 하나이고, n-gram 은 문장을 넘지 않습니다.
+    n_features 를 지정하면 해시 특징을 쓰고, 그렇지 않으면 `fit` 으로 만든 어휘를 씁니다.
+    중간에 '형태소/품사' 같은 문자열 목록을 만들지 않습니다.
+
+    scipy 가 설치되어 있으면 `transform` 으로 `scipy.sparse.csr_matrix` 를 얻을 수 있고,
+    그렇지 않으면 `transform_arrays` 로 CSR 배열을 직접 받을 수 있습니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> tagger = bn.Tagger()
+        >>> vec = bn.MorphemeVectorizer(ngram_range=(1, 2), tags=bn.NOUNS | bn.PREDICATES)
+        >>> docs = [tagger.tag(line) for line in open('corpus.txt')]
+        >>> X = vec.fit(docs).transform(docs)
+    """
+
+    def __init__(self, unit: str = 'morph_tag', ngram_range: Tuple[int, int] = (1, 1),
+                 tags=None, n_features: int = None, binary: bool = False):
+        """
+        Args:
+            unit (str, optional): 'morph', 'morph_tag', 'lemma' 중 하나
+            ngram_range (Tuple[int, int], optional): n-gram 의 최소, 최대 길이
+            tags (optional): 사용할 품사, `Tagged.select()` 와 같은 형식.
+                'lemma' 단위에서는 어절의 첫 형태소 품사로 거릅니다.
+            n_features (int, optional): 해시 특징의 차원, 지정하지 않으면 어휘를 학습합니다.
+            binary (bool, optional): 참이면 빈도 대신 1을 씁니다.
+        Raises:
+            ValueError: 인자가 잘못되면 에러를 발생시킵니다.
+        """
+        if unit not in UNITS:
+            raise ValueError(f"unit must be one of {UNITS}.")
+        lo, hi = ngram_range
+        if lo < 1 or hi < lo:
+            raise ValueError("invalid ngram_range.")
+        if n_features is not None and n_features < 1:
+            raise ValueError("n_features must be positive.")
+        self.unit = unit
+        self.ngram_range = (lo, hi)
+        self.mask = ALL_TAGS if tags is None else tag_mask(tags)
+        self.n_features = n_features
+        self.binary = binary
+        self.vocabulary = {}
+
+    @property
+    def hashed(self) -> bool:
+        """해시 특징을 쓰면 참입니다."""
+        return self.n_features is not None
+
+    def _units(self, res: AnalyzeSyntaxResponse) -> Iterator[list]:
+        """문장마다 단위(unit)의 목록을 만듭니다."""
+        keep = mask_table(self.mask)
+        unit = self.unit
+        hashed = self.hashed
+        crc = zlib.crc32
+        for s in res.sentences:
+            units = []
+            if unit == 'lemma':
+                for token in s.tokens:
+                    if token.morphemes and not keep[token.morphemes[0].tag]:
+                        continue
+                    lemma = token.lemma or token.text.content
+                    units.append(crc(lemma.encode('utf-8')) if hashed else lemma)
+            else:
+                with_tag = unit == 'morph_tag'
+                for token in s.tokens:
+                    for m in token.morphemes:
+                        tag = m.tag
+                        if not keep[tag]:
+                            continue
+                        content = m.text.content
+                        if hashed:
+                            units.append(crc(content.encode('utf-8'), tag if with_tag else 0))
+                        else:
+                            units.append((content, tag) if with_tag else content)
+            yield units
+
+    def _ngrams(self, units: list) -> Iterator:
+        lo, hi = self.ngram_range
+        n_units = len(units)
+        hashed = self.hashed
+        for i in range(n_units):
+            if hashed:
+                h = 0
+                for n in range(1, hi + 1):
+                    if i + n > n_units:
+                        break
+                    h = (h * _HASH_MULT ^ units[i + n - 1]) & 0xffffffff
+                    if n >= lo:
+                        yield h ^ n
+            else:
+                for n in range(lo, hi + 1):
+                    if i + n > n_units:
+                        break
+                    yield units[i] if n == 1 else tuple(units[i:i + n])
+
+    def partial_fit(self, results: Iterable[Union[Tagged, AnalyzeSyntaxResponse]]) -> 'MorphemeVectorizer':
+        """
+        어휘에 새 특징을 더합니다. 해시 특징을 쓰면 아무 일도 하지 않습니다.
+
+        Args:
+            results (Iterable): 형태소 분석 결과들
+
+        Returns:
+            MorphemeVectorizer: 자기 자신
+        """
+        if self.hashed:
+            return self
+        vocab = self.vocabulary
+        for r in results:
+            res = r.msg() if isinstance(r, Tagged) else r
+            for units in self._units(res):
+                for key in self._ngrams(units):
+                    if key not in vocab:
+                        vocab[key] = len(vocab)
+        return self
+
+    def fit(self, results: Iterable[Union[Tagged, AnalyzeSyntaxResponse]]) -> 'MorphemeVectorizer':
+        """
+        어휘를 새로 학습합니다.
+
+        Args:
+            results (Iterable): 형태소 분석 결과들
+
+        Returns:
+            MorphemeVectorizer: 자기 자신
+        """
+        self.vocabulary = {}
+        return self.partial_fit(results)
+
+    @property
+    def n_columns(self) -> int:
+        """특징 행렬의 열 수입니다."""
+        return self.n_features if self.hashed else len(self.vocabulary)
+
+    def transform_arrays(self, results: Iterable[Union[Tagged, AnalyzeSyntaxResponse]]) \
+            -> Tuple[array, array, array, Tuple[int, int]]:
+        """
+        결과들을 CSR 형식의 배열로 바꿉니다. 학습된 어휘에 없는 특징은 버립니다.
+
+        Args:
+            results (Iterable): 형태소 분석 결과들
+
+        Returns:
+            Tuple: (data, indices, indptr, shape),
+                `scipy.sparse.csr_matrix((data, indices, indptr), shape=shape)` 에 그대로 쓸 수 있습니다.
+        """
+        data = array('d')
+        indices = array('l')
+        indptr = array('l', [0])
+        hashed = self.hashed
+        n_features = self.n_features
+        vocab = self.vocabulary
+        binary = self.binary
+        for r in results:
+            res = r.msg() if isinstance(r, Tagged) else r
+            row = {}
+            for units in self._units(res):
+                for key in self._ngrams(units):
+                    if hashed:
+                        col = key % n_features
+                    else:
+                        col = vocab.get(key)
+                        if col is None:
+                            continue
+                    row[col] = row.get(col, 0) + 1
+            indices.extend(row.keys())
+            data.extend([1.0] * len(row) if binary else row.values())
+            indptr.append(len(indices))
+        return data, indices, indptr, (len(indptr) - 1, self.n_columns)
+
+    def transform(self, results: Iterable[Union[Tagged, AnalyzeSyntaxResponse]]):
+        """
+        결과들을 `scipy.sparse.csr_matrix` 로 바꿉니다.
+
+        Args:
+            results (Iterable): 형태소 분석 결과들
+
+        Raises:
+            ImportError: numpy, scipy 가 없으면 에러를 발생시킵니다.
+
+        Returns:
+            scipy.sparse.csr_matrix: 희소 특징 행렬
+        """
+        try:
+            import numpy as np
+            from scipy.sparse import csr_matrix
+        except ImportError as e:
+            raise ImportError("numpy and scipy are required for transform(), "
+                              "use transform_arrays() without them.") from e
+        data, indices, indptr, shape = self.transform_arrays(results)
+        return csr_matrix((np.frombuffer(data, dtype=np.float64),
+                           np.frombuffer(indices, dtype=np.dtype(f'i{indices.itemsize}')),
+                           np.frombuffer(indptr, dtype=np.dtype(f'i{indptr.itemsize}'))),
+                          shape=shape)
+
+    def transform_chunks(self, results: Iterable[Union[Tagged, AnalyzeSyntaxResponse]],
+                         chunk_size: int = 10000) -> Iterator:
+        """
+        결과의 흐름을 chunk_size 행씩 `scipy.sparse.csr_matrix` 로 바꿉니다.
+
+        Args:
+            results (Iterable): 형태소 분석 결과들, 생성자도 됩니다.
+            chunk_size (int, optional): 한 행렬의 최대 행 수
+
+        Returns:
+            Iterator: 희소 특징 행렬들
+        """
+        chunk = []
+        for r in results:
+            chunk.append(r)
+            if len(chunk) >= chunk_size:
+                yield self.transform(chunk)
+                chunk = []
+        if chunk:
+            yield self.transform(chunk)
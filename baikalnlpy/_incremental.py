@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import re
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+from baikal.language.language_service_pb2 import Sentence
+
+from baikalnlpy._tagger import Tagger, Tagged, shift_sentence
+
+_SEGMENT = re.compile(r'\S.*?(?:[.!?…]+(?=\s)|$)', re.M)
+
+
+def split_segments(text: str) -> List[Tuple[int, int]]:
+    """
+    문서를 줄바꿈과 문장 부호 뒤의 공백을 기준으로 구간으로 나눕니다.
+    구간의 앞뒤 공백은 포함하지 않습니다.
+
+    Args:
+        text (str): 문서
+
+    Returns:
+        List[Tuple[int, int]]: (시작 위치, 끝 위치)의 목록
+    """
+    ret = []
+    for m in _SEGMENT.finditer(text):
+        start, end = m.span()
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        ret.append((start, end))
+    return ret
+
+
+class IncrementalTagger:
+    """
+    편집 중인 문서를 문장 단위로 다시 분석하는 형태소 분석기.
+
+    문서를 구간(줄, 또는 문장 부호로 끝나는 문장)으로 나누고, 구간의 내용을 키로
+    분석 결과(`Sentence`)를 구간 안의 위치로 보관합니다. 새로 생기거나 바뀐 구간만 한 번의
+    요청으로 `analyze_syntax` 에 보내고, 보관한 결과를 복사하지 않고 구간의 시작 위치와 함께
+    `Tagged` 에 넘깁니다. 문서 전체의 위치는 결과를 읽을 때 더하므로, 원격 호출과 형태소를
+    고치는 작업은 편집한 양에만 비례합니다. `Tagged.msg()` 처럼 메시지 전체가 필요할 때에만
+    문서 전체를 복사합니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> inc = bn.IncrementalTagger(bn.Tagger())
+        >>> tagged = inc.tag(document)
+        >>> tagged = inc.tag(edited_document)  # 바뀐 문장만 보냅니다.
+    """
+
+    def __init__(self, tagger: Tagger, auto_split: bool = True):
+        """
+        Args:
+            tagger (Tagger): 실제 분석에 쓸 형태소 분석기
+            auto_split (bool, optional): 구간 안의 문장 자동 분리 여부
+        """
+        self.tagger = tagger
+        self.auto_split = auto_split
+        self.cache: Dict[str, List[Sentence]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _analyze(self, segments: List[str]):
+        """새 구간들을 한 번에 분석해서 구간별로 상대 위치의 문장을 보관합니다."""
+        content = '\n'.join(segments)
+        res = self.tagger._analyze(content, self.auto_split)
+        bases = []
+        base = 0
+        for seg in segments:
+            bases.append(base)
+            self.cache[seg] = []
+            base += len(seg) + 1
+        for s in res.sentences:
+            i = bisect_right(bases, s.text.begin_offset) - 1
+            shift_sentence(s, -bases[i])
+            self.cache[segments[i]].append(s)
+
+    def tag(self, document: str) -> Tagged:
+        """
+        문서를 분석합니다. 이전 호출 이후 바뀌지 않은 구간은 다시 보내지 않습니다.
+
+        Args:
+            document (str): 문서 전체
+
+        Raises:
+            e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
+
+        Returns:
+            Tagged: 문서 전체의 분석 결과
+        """
+        spans = split_segments(document)
+        texts = [document[b:e] for b, e in spans]
+        missing = list(dict.fromkeys(t for t in texts if t not in self.cache))
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        if missing:
+            self._analyze(missing)
+
+        segments = [(begin, self.cache[text]) for (begin, _), text in zip(spans, texts)]
+
+        # 지금 문서에 없는 구간은 버려서 보관하는 양을 문서 크기로 제한한다.
+        current = set(texts)
+        if len(self.cache) > len(current):
+            self.cache = {k: v for k, v in self.cache.items() if k in current}
+        return Tagged(document, segments)
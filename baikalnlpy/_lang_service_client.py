@@ -4,6 +4,7 @@ import baikal.language.language_service_pb2 as pb
 import baikal.language.language_service_pb2_grpc as ls
 
 MAX_MESSAGE_LENGTH = 100 * 1024 * 1024
+ANALYZE_SYNTAX_METHOD = '/baikal.language.LanguageService/AnalyzeSyntax'
 
 
 class BaikalLanguageServiceClient:
@@ -11,36 +12,44 @@ class BaikalLanguageServiceClient:
     형태소 분석을 처리하는 클라이언트
     """
 
-    def __init__(self, remote: str):
+    def __init__(self, remote: str, channel: grpc.Channel = None, options: list = None):
         """
         클라이언트 생성자
 
         Args:
             remote (str): 원격 주소, IP주소:포트 또는 호스트이름:포트 형식으로 사용합니다.
+            channel (grpc.Channel, optional): 지정하면 remote 대신 이 채널을 사용합니다.
+                `RecordingChannel`, `ReplayChannel` 을 넘길 수 있습니다.
+            options (list, optional): 채널을 열 때 더할 gRPC 채널 옵션들
         """
-        channel = grpc.insecure_channel(
-            remote,
-            options=[
-                ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
-                ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
-            ])
+        if channel is None:
+            channel = grpc.insecure_channel(
+                remote,
+                options=[
+                    ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
+                    ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
+                ] + list(options or []))
 
+        self.channel = channel
         self.stub = ls.LanguageServiceStub(channel)
+        # 응답을 해석하지 않고 직렬화된 바이트 그대로 돌려받는 호출
+        self.raw_analyze_syntax = channel.unary_unary(
+            ANALYZE_SYNTAX_METHOD,
+            request_serializer=pb.AnalyzeSyntaxRequest.SerializeToString,
+            response_deserializer=None)
 
-    def analyze_syntax(self, content: str, domain: str = "", auto_split=False) -> pb.AnalyzeSyntaxResponse:
+    @staticmethod
+    def build_request(content: str, domain: str = "", auto_split=False) -> pb.AnalyzeSyntaxRequest:
         """
-        형태소 분석을 수행합니다.
+        형태소 분석 요청 메시지를 만듭니다.
 
         Args:
-            content (str): 형태소 분석할 원문, 여러 문장일 경우에 개행문자로 줄바꿈을 하면 됩니다.
+            content (str): 형태소 분석할 원문
             domain (str, optional): 사용사 사전의 이름. 기본값은 "".
             auto_split (bool, optional): 문장 자동 분리 여부, 기본값은 사용하지 않음.
 
-        Raises:
-            e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
-
         Returns:
-            pb.AnalyzeSyntaxResponse: 형태소 분석 결과
+            pb.AnalyzeSyntaxRequest: 형태소 분석 요청
         """
         req = pb.AnalyzeSyntaxRequest()
         # req.document = pb.Document()
@@ -50,9 +59,53 @@ class BaikalLanguageServiceClient:
         req.auto_split_sentence = auto_split
         if domain:
             req.custom_domain = domain
+        return req
+
+    def analyze_syntax(self, content: str, domain: str = "", auto_split=False,
+                       timeout: float = None) -> pb.AnalyzeSyntaxResponse:
+        """
+        형태소 분석을 수행합니다.
+
+        Args:
+            content (str): 형태소 분석할 원문, 여러 문장일 경우에 개행문자로 줄바꿈을 하면 됩니다.
+            domain (str, optional): 사용사 사전의 이름. 기본값은 "".
+            auto_split (bool, optional): 문장 자동 분리 여부, 기본값은 사용하지 않음.
+            timeout (float, optional): 요청 제한 시간(초), 기본값은 제한 없음.
+
+        Raises:
+            e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
+
+        Returns:
+            pb.AnalyzeSyntaxResponse: 형태소 분석 결과
+        """
+        req = self.build_request(content, domain, auto_split)
         try:
-            res = self.stub.AnalyzeSyntax(req)
+            res = self.stub.AnalyzeSyntax(req, timeout=timeout)
             return res
         except grpc.RpcError as e:
             raise e
 
+    def analyze_syntax_raw(self, content: str, domain: str = "", auto_split=False,
+                           timeout: float = None) -> bytes:
+        """
+        형태소 분석을 수행하고 응답을 해석하지 않은 채 직렬화된 바이트로 돌려줍니다.
+        결과를 다른 시스템에 넘기거나 저장만 할 때 protobuf 해석 비용을 아낄 수 있습니다.
+
+        Args:
+            content (str): 형태소 분석할 원문, 여러 문장일 경우에 개행문자로 줄바꿈을 하면 됩니다.
+            domain (str, optional): 사용사 사전의 이름. 기본값은 "".
+            auto_split (bool, optional): 문장 자동 분리 여부, 기본값은 사용하지 않음.
+            timeout (float, optional): 요청 제한 시간(초), 기본값은 제한 없음.
+
+        Raises:
+            e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
+
+        Returns:
+            bytes: 직렬화된 pb.AnalyzeSyntaxResponse
+        """
+        req = self.build_request(content, domain, auto_split)
+        try:
+            return self.raw_analyze_syntax(req, timeout=timeout)
+        except grpc.RpcError as e:
+            raise e
+
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+import random
+import re
+import threading
+import time
+from concurrent import futures
+from typing import Dict, List
+
+import grpc
+
+from baikal.language.language_service_pb2 import AnalyzeSyntaxResponse, Morpheme
+from baikal.language.language_service_pb2_grpc import LanguageServiceServicer, \
+    add_LanguageServiceServicer_to_server
+
+from baikalnlpy._lang_service_client import MAX_MESSAGE_LENGTH
+from baikalnlpy._tagger import Tagger
+
+_WORD = re.compile(r'\S+')
+_LINE = re.compile(r'[^\n]+')
+
+
+class StandInLanguageService(LanguageServiceServicer):
+    """
+    부하 시험에 쓰는 가짜 형태소 분석 서버.
+    줄마다 한 문장, 어절마다 NNG 형태소 하나를 돌려줍니다.
+    """
+
+    def __init__(self, latency: float = 0.0, chars_per_sec: float = 0.0):
+        """
+        Args:
+            latency (float, optional): 요청마다 더할 지연(초)
+            chars_per_sec (float, optional): 0보다 크면 글자 수에 비례한 지연을 더합니다.
+        """
+        self.latency = latency
+        self.chars_per_sec = chars_per_sec
+
+    def AnalyzeSyntax(self, request, context):
+        content = request.document.content
+        delay = self.latency
+        if self.chars_per_sec > 0:
+            delay += len(content) / self.chars_per_sec
+        if delay > 0:
+            time.sleep(delay)
+        res = AnalyzeSyntaxResponse()
+        for line in _LINE.finditer(content):
+            s = res.sentences.add()
+            s.text.content = line.group()
+            s.text.begin_offset = line.start()
+            for w in _WORD.finditer(line.group()):
+                word = w.group()
+                t = s.tokens.add()
+                t.text.content = word
+                t.text.begin_offset = line.start() + w.start()
+                t.lemma = word
+                t.tagged = word + '/NNG'
+                m = t.morphemes.add()
+                m.text.content = word
+                m.text.begin_offset = t.text.begin_offset
+                m.tag = Morpheme.Tag.NNG
+                m.probability = 1.0
+        return res
+
+
+def start_stand_in(port: int = 0, host: str = 'localhost', latency: float = 0.0,
+                   chars_per_sec: float = 0.0, max_workers: int = 16) -> grpc.Server:
+    """
+    가짜 형태소 분석 서버를 엽니다.
+
+    Args:
+        port (int, optional): 열 포트, 0이면 빈 포트를 고릅니다.
+        host (str, optional): 열 주소
+        latency (float, optional): 요청마다 더할 지연(초)
+        chars_per_sec (float, optional): 0보다 크면 글자 수에 비례한 지연을 더합니다.
+        max_workers (int, optional): 요청을 처리할 쓰레드 수
+
+    Returns:
+        grpc.Server: 시작한 서버, `server.bound_port` 에 실제 포트가 있습니다.
+    """
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        options=[
+            ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
+            ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
+        ])
+    add_LanguageServiceServicer_to_server(StandInLanguageService(latency, chars_per_sec), server)
+    server.bound_port = server.add_insecure_port(f'{host}:{port}')
+    server.start()
+    return server
+
+
+def parse_size(spec: str):
+    """
+    요청 크기 분포를 해석합니다. 크기는 요청 하나에 넣을 말뭉치의 줄 수입니다.
+
+    Args:
+        spec (str): 'fixed:N' 또는 'uniform:A:B'
+
+    Raises:
+        ValueError: 형식이 잘못되면 에러를 발생시킵니다.
+
+    Returns:
+        Callable[[random.Random], int]: 줄 수를 뽑는 함수
+    """
+    parts = spec.split(':')
+    try:
+        if parts[0] == 'fixed' and len(parts) == 2:
+            n = int(parts[1])
+            if n >= 1:
+                return lambda rnd: n
+        elif parts[0] == 'uniform' and len(parts) == 3:
+            a, b = int(parts[1]), int(parts[2])
+            if 1 <= a <= b:
+                return lambda rnd: rnd.randint(a, b)
+    except ValueError:
+        pass
+    raise ValueError(f"invalid size distribution: {spec}, use fixed:N or uniform:A:B")
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """정렬된 값들의 p 백분위수(nearest rank)를 돌려줍니다."""
+    if not sorted_values:
+        return 0.0
+    k = max(int(len(sorted_values) * p / 100.0 + 0.999999) - 1, 0)
+    return sorted_values[min(k, len(sorted_values) - 1)]
+
+
+class LoadTest:
+    """
+    말뭉치를 하나 이상의 바이칼 NLP 서버에 보내 처리량과 지연을 잽니다.
+
+    closed 모드는 concurrency 개의 쓰레드가 응답을 받자마자 다음 요청을 보냅니다.
+    open 모드는 rate 에 맞춰 정해진 시각에 요청을 보내고, 지연은 보내려던 시각부터 잽니다.
+    서버가 따라가지 못해 밀린 시간도 지연에 들어갑니다.
+
+    .. code-block:: python
+        >>> from baikalnlpy._loadtest import LoadTest
+        >>> lines = open('corpus.txt').read().splitlines()
+        >>> report = LoadTest(['localhost:5656'], lines, concurrency=8, duration=30).run()
+        >>> report['latency']['p99']
+    """
+
+    def __init__(self, endpoints: List[str], corpus: List[str],
+                 concurrency: int = 4, size: str = 'fixed:1',
+                 domain: str = '', auto_split: bool = False,
+                 mode: str = 'closed', rate: float = 10.0,
+                 duration: float = 10.0, requests: int = 0,
+                 timeout: float = None, seed: int = None):
+        """
+        Args:
+            endpoints (List[str]): 서버 주소들, 호스트이름:포트 형식. 돌아가며 사용합니다.
+            corpus (List[str]): 보낼 줄들, 빈 줄은 뺍니다.
+            concurrency (int, optional): 동시 요청 수
+            size (str, optional): 요청 크기 분포, `parse_size` 참고
+            domain (str, optional): 사용자 사전의 이름
+            auto_split (bool, optional): 문장 자동 분리 여부
+            mode (str, optional): 'closed' 또는 'open'
+            rate (float, optional): open 모드의 초당 요청 수
+            duration (float, optional): 시험 시간(초)
+            requests (int, optional): 0보다 크면 이만큼 보내고 끝냅니다.
+            timeout (float, optional): 요청 제한 시간(초)
+            seed (int, optional): 요청 크기와 시작 위치를 뽑을 난수 씨앗
+        Raises:
+            ValueError: 인자가 잘못되면 에러를 발생시킵니다.
+        """
+        if not endpoints:
+            raise ValueError("at least one endpoint must be specified.")
+        self.corpus = [line for line in corpus if line.strip()]
+        if not self.corpus:
+            raise ValueError("corpus is empty.")
+        if mode not in ('closed', 'open'):
+            raise ValueError("mode must be closed or open.")
+        if concurrency < 1 or (mode == 'open' and rate <= 0):
+            raise ValueError("concurrency and rate must be positive.")
+        self.endpoints = list(endpoints)
+        self.taggers = []
+        for ep in self.endpoints:
+            host, _, port = ep.rpartition(':')
+            self.taggers.append(Tagger(host, int(port), domain))
+        self.concurrency = concurrency
+        self.size = parse_size(size)
+        self.auto_split = auto_split
+        self.mode = mode
+        self.rate = rate
+        self.duration = duration
+        self.requests = requests
+        self.timeout = timeout
+        self.rnd = random.Random(seed)
+
+        self._lock = threading.Lock()
+        self._issued = 0
+        self._latencies = []
+        self._chars = 0
+        self._errors: Dict[str, int] = {}
+
+    def _next_request(self):
+        """보낼 요청을 고릅니다. 더 보낼 것이 없으면 None 을 돌려줍니다."""
+        with self._lock:
+            if self.requests and self._issued >= self.requests:
+                return None
+            n = self._issued
+            self._issued += 1
+            lines = self.size(self.rnd)
+            start = self.rnd.randrange(len(self.corpus))
+        chunk = [self.corpus[(start + i) % len(self.corpus)] for i in range(lines)]
+        return self.taggers[n % len(self.taggers)], '\n'.join(chunk)
+
+    def _send(self, tagger: Tagger, content: str, started: float):
+        try:
+            tagger.tag(content, self.auto_split, timeout=self.timeout)
+            latency = time.monotonic() - started
+            with self._lock:
+                self._latencies.append(latency)
+                self._chars += len(content)
+        except grpc.RpcError as e:
+            code = e.code().name if hasattr(e, 'code') and e.code() else 'UNKNOWN'
+            with self._lock:
+                self._errors[code] = self._errors.get(code, 0) + 1
+
+    def _run_closed(self, stop_at: float):
+        def worker():
+            while time.monotonic() < stop_at:
+                req = self._next_request()
+                if req is None:
+                    return
+                self._send(req[0], req[1], time.monotonic())
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.concurrency)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _run_open(self, stop_at: float):
+        interval = 1.0 / self.rate
+        with futures.ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            intended = time.monotonic()
+            while intended < stop_at:
+                now = time.monotonic()
+                if intended > now:
+                    time.sleep(intended - now)
+                req = self._next_request()
+                if req is None:
+                    break
+                pool.submit(self._send, req[0], req[1], intended)
+                intended += interval
+
+    def run(self) -> Dict:
+        """
+        부하 시험을 실행합니다.
+
+        Returns:
+            Dict: JSON 으로 바꿀 수 있는 결과
+        """
+        start = time.monotonic()
+        stop_at = start + self.duration
+        if self.mode == 'closed':
+            self._run_closed(stop_at)
+        else:
+            self._run_open(stop_at)
+        elapsed = time.monotonic() - start
+
+        lat = sorted(self._latencies)
+        ok = len(lat)
+        errors = sum(self._errors.values())
+        total = ok + errors
+        return {
+            'endpoints': self.endpoints,
+            'mode': self.mode,
+            'concurrency': self.concurrency,
+            'rate': self.rate if self.mode == 'open' else None,
+            'duration': elapsed,
+            'requests': total,
+            'errors': errors,
+            'error_rate': errors / total if total else 0.0,
+            'errors_by_code': dict(self._errors),
+            'chars': self._chars,
+            'chars_per_sec': self._chars / elapsed if elapsed > 0 else 0.0,
+            'requests_per_sec': ok / elapsed if elapsed > 0 else 0.0,
+            'latency': {
+                'mean': sum(lat) / ok if ok else 0.0,
+                'p50': percentile(lat, 50),
+                'p90': percentile(lat, 90),
+                'p99': percentile(lat, 99),
+                'max': lat[-1] if lat else 0.0,
+            },
+        }
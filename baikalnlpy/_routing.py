@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import itertools
+from typing import List
+
+import grpc
+
+FAILOVER_CODES = frozenset([grpc.StatusCode.UNAVAILABLE])
+
+
+def _score(domain: str, endpoint: str) -> int:
+    h = hashlib.blake2b(f'{domain}\0{endpoint}'.encode('utf-8'), digest_size=8)
+    return int.from_bytes(h.digest(), 'big')
+
+
+class DomainRouter:
+    """
+    사용자 사전 도메인마다 정해진 서버들로 요청을 보내는 라우터.
+
+    rendezvous(HRW) 해싱으로 도메인마다 서버의 순위를 정하고, 앞의 replicas 개 서버가
+    그 도메인을 맡습니다. 서버가 늘거나 줄어도 그 서버가 맡던 도메인만 옮겨갑니다.
+    요청은 맡은 서버들 사이에서 돌아가며 보내고, 서버에 닿지 않으면 다음 서버로 넘어갑니다.
+    spill 이 참이면 맡은 서버가 모두 실패할 때 나머지 서버도 순위대로 시도합니다.
+    도메인이 없는 요청은 모든 서버에 돌아가며 보냅니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> tagger = bn.Tagger(endpoints=['nlp1:5656', 'nlp2:5656', 'nlp3:5656'], replicas=2)
+        >>> tagger.set_domain('law')
+        >>> tagger.pos('근저당권 설정')       # 'law' 를 맡은 두 서버 중 하나로 갑니다.
+        >>> tagger.custom_dict('law').update()  # 'law' 를 맡은 두 서버 모두 갱신합니다.
+    """
+
+    def __init__(self, endpoints: List[str], replicas: int = 2, spill: bool = False):
+        """
+        Args:
+            endpoints (List[str]): 서버 주소들, 호스트이름:포트 형식
+            replicas (int, optional): 도메인마다 맡을 서버의 수
+            spill (bool, optional): 맡은 서버가 모두 실패하면 나머지 서버도 시도할지 여부
+        Raises:
+            ValueError: 서버가 없거나 replicas 가 1보다 작으면 에러를 발생시킵니다.
+        """
+        endpoints = list(dict.fromkeys(endpoints))
+        if not endpoints:
+            raise ValueError("at least one endpoint must be specified.")
+        if replicas < 1:
+            raise ValueError("replicas must be positive.")
+        self.endpoints = endpoints
+        self.replicas = replicas
+        self.spill = spill
+        self._rr = itertools.count()
+        self._rankings = {}
+
+    def ranking(self, domain: str) -> List[str]:
+        """
+        도메인에 대한 모든 서버의 순위를 돌려줍니다.
+
+        Args:
+            domain (str): 사용자 사전의 이름
+
+        Returns:
+            List[str]: 점수가 높은 순서의 서버 주소들
+        """
+        ranked = self._rankings.get(domain)
+        if ranked is None:
+            ranked = sorted(self.endpoints, key=lambda ep: _score(domain, ep), reverse=True)
+            self._rankings[domain] = ranked
+        return ranked
+
+    def owners(self, domain: str) -> List[str]:
+        """
+        도메인을 맡은 서버들을 돌려줍니다. 도메인이 없으면 모든 서버입니다.
+
+        Args:
+            domain (str): 사용자 사전의 이름
+
+        Returns:
+            List[str]: 서버 주소들
+        """
+        if not domain:
+            return list(self.endpoints)
+        return self.ranking(domain)[:self.replicas]
+
+    def route(self, domain: str) -> List[str]:
+        """
+        요청 하나를 보낼 서버들을 시도할 순서대로 돌려줍니다.
+        맡은 서버들 사이의 시작점은 호출마다 돌아갑니다.
+
+        Args:
+            domain (str): 사용자 사전의 이름
+
+        Returns:
+            List[str]: 서버 주소들
+        """
+        if not domain:
+            ranked = list(self.endpoints)
+            owners, rest = ranked, []
+        else:
+            ranked = self.ranking(domain)
+            owners, rest = ranked[:self.replicas], ranked[self.replicas:]
+        k = next(self._rr) % len(owners)
+        order = owners[k:] + owners[:k]
+        if self.spill:
+            order += rest
+        return order
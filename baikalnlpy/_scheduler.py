@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+import grpc
+
+INTERACTIVE = 'interactive'
+BULK = 'bulk'
+
+
+class QueueTimeout(grpc.RpcError, TimeoutError):
+    """
+    스케줄러 대기열에서 마감 시각이 지나면 발생하는 에러.
+    호출 중에 제한 시간이 지난 것과 같이 DEADLINE_EXCEEDED 상태의 `grpc.RpcError` 입니다.
+    """
+
+    def __init__(self, details: str):
+        super().__init__(details)
+        self._details = details
+
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.DEADLINE_EXCEEDED
+
+    def details(self) -> str:
+        return self._details
+
+
+class _Waiter:
+    __slots__ = ('key', 'priority', 'enqueued', 'granted')
+
+    def __init__(self, key: Tuple, priority: str):
+        self.key = key
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.granted = False
+
+    def __lt__(self, other: '_Waiter') -> bool:
+        return self.key < other.key
+
+
+class RequestScheduler:
+    """
+    `Tagger` 의 원격 호출 앞에서 우선순위에 따라 순서를 정하는 스케줄러.
+
+    요청은 우선순위 클래스에 속합니다. 앞선 클래스의 요청이 항상 먼저 실행되고,
+    같은 클래스 안에서는 마감 시각이 이른 요청, 그 다음에는 먼저 온 요청이 먼저 실행됩니다.
+    전체 동시 실행 수와 클래스별 동시 실행 수를 제한하므로, 대량 작업이 실행 슬롯을
+    모두 차지하지 못합니다. 대량 요청은 chunk_chars 글자 단위로 나누어 보내므로
+    사용자 요청이 그 사이에 끼어들 수 있습니다. 클래스별 대기 시간을 `stats()` 로 볼 수 있습니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> sched = bn.RequestScheduler({'interactive': 8, 'bulk': 2}, max_concurrency=8)
+        >>> tagger = bn.Tagger(scheduler=sched)
+        >>> tagger.tags(many_lines, priority='bulk')  # 다른 쓰레드에서
+        >>> tagger.pos('안녕하세요.')               # 대량 작업보다 먼저 실행됩니다.
+        >>> sched.stats()['interactive']['mean_wait']
+    """
+
+    def __init__(self, classes: Dict[str, int] = None, max_concurrency: int = 8,
+                 chunk_chars: int = 16 * 1024):
+        """
+        Args:
+            classes (Dict[str, int], optional): 우선순위 순서대로 나열한 클래스 이름과
+                클래스별 최대 동시 실행 수. 기본값은 {'interactive': 8, 'bulk': 2}
+            max_concurrency (int, optional): 전체 최대 동시 실행 수
+            chunk_chars (int, optional): 대량 요청을 나누는 글자 수
+        Raises:
+            ValueError: 클래스가 없거나 제한이 1보다 작으면 에러를 발생시킵니다.
+        """
+        if classes is None:
+            classes = {INTERACTIVE: max_concurrency, BULK: max(max_concurrency // 4, 1)}
+        if not classes or max_concurrency < 1 or min(classes.values()) < 1:
+            raise ValueError("invalid scheduler limits.")
+        self.limits = dict(classes)
+        self.ranks = {name: i for i, name in enumerate(classes)}
+        self.max_concurrency = max_concurrency
+        self.chunk_chars = chunk_chars
+
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._waiting: List[_Waiter] = []
+        self._running = {name: 0 for name in classes}
+        self._total_running = 0
+        self._completed = {name: 0 for name in classes}
+        self._wait_sum = {name: 0.0 for name in classes}
+        self._wait_max = {name: 0.0 for name in classes}
+
+    @property
+    def default_priority(self) -> str:
+        """가장 앞선 클래스의 이름"""
+        return next(iter(self.limits))
+
+    def _dispatch(self):
+        """실행할 수 있는 대기 요청에 순서대로 슬롯을 줍니다. 잠금 안에서 부릅니다."""
+        skipped = []
+        granted = False
+        while self._waiting and self._total_running < self.max_concurrency:
+            w = heapq.heappop(self._waiting)
+            if self._running[w.priority] >= self.limits[w.priority]:
+                skipped.append(w)
+                continue
+            w.granted = True
+            granted = True
+            self._running[w.priority] += 1
+            self._total_running += 1
+            wait = time.monotonic() - w.enqueued
+            self._wait_sum[w.priority] += wait
+            if wait > self._wait_max[w.priority]:
+                self._wait_max[w.priority] = wait
+        for w in skipped:
+            heapq.heappush(self._waiting, w)
+        if granted:
+            self._cond.notify_all()
+
+    def acquire(self, priority: str = None, deadline: float = None) -> _Waiter:
+        """
+        실행 슬롯을 얻을 때까지 기다립니다.
+
+        Args:
+            priority (str, optional): 우선순위 클래스, 기본값은 가장 앞선 클래스
+            deadline (float, optional): `time.monotonic()` 기준 마감 시각
+
+        Raises:
+            ValueError: 알 수 없는 클래스이면 에러를 발생시킵니다.
+            QueueTimeout: 슬롯을 얻기 전에 마감 시각이 지나면 에러를 발생시킵니다.
+
+        Returns:
+            _Waiter: `release()` 에 넘길 값
+        """
+        if priority is None:
+            priority = self.default_priority
+        if priority not in self.ranks:
+            raise ValueError(f"unknown priority class: {priority}")
+        key = (self.ranks[priority], deadline if deadline is not None else float('inf'), next(self._seq))
+        w = _Waiter(key, priority)
+        with self._cond:
+            heapq.heappush(self._waiting, w)
+            self._dispatch()
+            while not w.granted:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._waiting.remove(w)
+                    heapq.heapify(self._waiting)
+                    raise QueueTimeout("deadline exceeded while waiting in scheduler queue.")
+                self._cond.wait(remaining)
+        return w
+
+    def release(self, w: _Waiter):
+        """
+        슬롯을 돌려주고 다음 요청을 실행합니다.
+
+        Args:
+            w (_Waiter): `acquire()` 가 돌려준 값
+        """
+        with self._cond:
+            self._running[w.priority] -= 1
+            self._total_running -= 1
+            self._completed[w.priority] += 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, priority: str = None, deadline: float = None):
+        """
+        `acquire()` 와 `release()` 를 묶은 컨텍스트 관리자.
+
+        Args:
+            priority (str, optional): 우선순위 클래스
+            deadline (float, optional): `time.monotonic()` 기준 마감 시각
+        """
+        w = self.acquire(priority, deadline)
+        try:
+            yield w
+        finally:
+            self.release(w)
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        클래스별 상태를 돌려줍니다.
+
+        Returns:
+            Dict: 클래스마다 waiting, running, completed(끝난 요청 수),
+                mean_wait, max_wait(슬롯을 얻기까지 기다린 시간, 초)
+        """
+        with self._cond:
+            waiting = {name: 0 for name in self.limits}
+            for w in self._waiting:
+                waiting[w.priority] += 1
+            ret = {}
+            for name in self.limits:
+                granted = self._completed[name] + self._running[name]
+                ret[name] = {
+                    'waiting': waiting[name],
+                    'running': self._running[name],
+                    'completed': self._completed[name],
+                    'mean_wait': self._wait_sum[name] / granted if granted else 0.0,
+                    'max_wait': self._wait_max[name],
+                }
+            return ret
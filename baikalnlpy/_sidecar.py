@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent import futures
+from typing import Dict, List
+
+import grpc
+
+from baikalnlpy._lang_service_client import BaikalLanguageServiceClient, ANALYZE_SYNTAX_METHOD, \
+    MAX_MESSAGE_LENGTH
+from baikalnlpy._custom_dict_client import CustomDictionaryServiceClient
+
+LANGUAGE_SERVICE = 'baikal.language.LanguageService'
+CUSTOM_DICT_SERVICE = 'baikal.language.CustomDictionaryService'
+CUSTOM_DICT_READS = ('GetCustomDictionaryList', 'GetCustomDictionary')
+CUSTOM_DICT_WRITES = ('UpdateCustomDictionary', 'RemoveCustomDictionaries')
+
+
+class ResultCache:
+    """
+    직렬화된 요청을 키로 직렬화된 응답을 보관하는 LRU 캐시.
+    보관하는 응답 바이트의 합이 max_bytes 를 넘지 않도록 오래된 것부터 버립니다.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (int, optional): 보관할 응답 바이트의 최대 합
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: bytes, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, v = self._items.popitem(last=False)
+                self.size -= len(v)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class TaggingProxy:
+    """
+    여러 원격 바이칼 NLP 서버 앞에서 결과를 공유하는 프록시.
+
+    형태소 분석 요청과 응답을 해석하지 않고 바이트 그대로 다룹니다.
+    같은 요청은 캐시에서 돌려주고, 동시에 들어온 같은 요청은 원격 호출 한 번으로 합칩니다.
+    원격 서버마다 연결을 따로 가진 채널을 여러 개 열어 두고 돌아가며 사용합니다.
+    사용자 사전 조회는 한 서버로, 갱신과 삭제는 모든 서버로 보내고 캐시를 비웁니다.
+    """
+
+    def __init__(self, upstreams: List[str], cache_bytes: int = 256 * 1024 * 1024, pool_size: int = 2):
+        """
+        Args:
+            upstreams (List[str]): 원격 서버 주소들, 호스트이름:포트 형식
+            cache_bytes (int, optional): 캐시에 보관할 응답 바이트의 최대 합
+            pool_size (int, optional): 원격 서버마다 열어 둘 연결의 수
+        Raises:
+            ValueError: 원격 서버가 없으면 에러를 발생시킵니다.
+        """
+        if not upstreams:
+            raise ValueError("at least one upstream must be specified.")
+        self.upstreams = list(upstreams)
+        self.cache = ResultCache(cache_bytes)
+        self._analyze = []
+        for remote in self.upstreams:
+            for _ in range(max(pool_size, 1)):
+                # 같은 주소의 채널은 gRPC 가 연결 하나를 나눠 쓰므로, 채널마다 따로 연결하게 한다.
+                client = BaikalLanguageServiceClient(remote, options=[('grpc.use_local_subchannel_pool', 1)])
+                self._analyze.append(client.channel.unary_unary(ANALYZE_SYNTAX_METHOD))
+        self._dict_channels = [CustomDictionaryServiceClient(remote).channel for remote in self.upstreams]
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[bytes, futures.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def analyze_syntax(self, request: bytes, timeout: float = None) -> bytes:
+        """
+        직렬화된 형태소 분석 요청을 처리합니다.
+
+        Args:
+            request (bytes): 직렬화된 AnalyzeSyntaxRequest
+            timeout (float, optional): 원격 호출 제한 시간(초)
+
+        Raises:
+            e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
+
+        Returns:
+            bytes: 직렬화된 AnalyzeSyntaxResponse
+        """
+        res = self.cache.get(request)
+        with self._lock:
+            if res is not None:
+                self.hits += 1
+                return res
+            waiting = self._in_flight.get(request)
+            if waiting is None:
+                mine = futures.Future()
+                self._in_flight[request] = mine
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if waiting is not None:
+            return waiting.result(timeout)
+
+        try:
+            call = self._analyze[next(self._next) % len(self._analyze)]
+            res = call(request, timeout=timeout)
+            self.cache.put(request, res)
+            mine.set_result(res)
+            return res
+        except BaseException as e:
+            mine.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[request]
+
+    def custom_dict(self, method: str, request: bytes, timeout: float = None) -> bytes:
+        """
+        사용자 사전 요청을 원격 서버로 넘깁니다.
+
+        Args:
+            method (str): CustomDictionaryService 의 메소드 이름
+            request (bytes): 직렬화된 요청
+            timeout (float, optional): 원격 호출 제한 시간(초)
+
+        Raises:
+            e: grpc.Error, 원격 호출시 예외가 발생할 수 있습니다.
+
+        Returns:
+            bytes: 직렬화된 응답, 여러 서버로 보내면 첫 서버의 응답
+        """
+        path = f'/{CUSTOM_DICT_SERVICE}/{method}'
+        if method in CUSTOM_DICT_WRITES:
+            # 일부 서버만 갱신되고 실패해도 예전 사전의 결과를 돌려주지 않도록 캐시는 항상 비운다.
+            try:
+                responses = [c.unary_unary(path)(request, timeout=timeout) for c in self._dict_channels]
+            finally:
+                self.cache.clear()
+            return responses[0]
+        channel = self._dict_channels[next(self._next) % len(self._dict_channels)]
+        return channel.unary_unary(path)(request, timeout=timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: hits, misses, coalesced, cached(캐시 항목 수), cache_bytes
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'cached': len(self.cache),
+            'cache_bytes': self.cache.size,
+        }
+
+
+def _unary(fn):
+    def handler(request, context):
+        # 호출자가 제한 시간을 주지 않으면 아주 큰 값이 오므로 제한 없음으로 넘긴다.
+        timeout = context.time_remaining()
+        if timeout is not None and timeout > 24 * 3600:
+            timeout = None
+        try:
+            return fn(request, timeout)
+        except grpc.RpcError as e:
+            context.abort(e.code(), e.details())
+        except futures.TimeoutError:
+            # 같은 요청을 기다리다 제한 시간이 지난 경우
+            context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, 'Deadline Exceeded')
+    return grpc.unary_unary_rpc_method_handler(handler)
+
+
+def serve(proxy: TaggingProxy, port: int = 5656, host: str = 'localhost', max_workers: int = 32) -> grpc.Server:
+    """
+    프록시를 LanguageService, CustomDictionaryService gRPC 서버로 엽니다.
+    `Tagger('localhost', port)` 로 그대로 사용할 수 있습니다.
+
+    Args:
+        proxy (TaggingProxy): 요청을 처리할 프록시
+        port (int, optional): 열 포트, 0이면 빈 포트를 고릅니다.
+        host (str, optional): 열 주소, 기본값은 이 컴퓨터에서만 접속할 수 있는 localhost.
+            인증 없이 사용자 사전을 바꿀 수 있으므로, 다른 컴퓨터에 열 때에만 '[::]' 등을 지정합니다.
+        max_workers (int, optional): 요청을 처리할 쓰레드 수
+
+    Returns:
+        grpc.Server: 시작한 서버, `server.bound_port` 에 실제 포트가 있습니다.
+    """
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        options=[
+            ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
+            ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
+        ])
+    server.add_generic_rpc_handlers((
+        grpc.method_handlers_generic_handler(LANGUAGE_SERVICE, {
+            'AnalyzeSyntax': _unary(proxy.analyze_syntax),
+        }),
+        grpc.method_handlers_generic_handler(CUSTOM_DICT_SERVICE, {
+            m: _unary(lambda req, timeout, m=m: proxy.custom_dict(m, req, timeout))
+            for m in CUSTOM_DICT_READS + CUSTOM_DICT_WRITES
+        }),
+    ))
+    server.bound_port = server.add_insecure_port(f'{host}:{port}')
+    server.start()
+    return server
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
+
+from baikal.language.language_service_pb2 import Morpheme
+
+
+def _name_table(enum) -> Tuple[str, ...]:
+    names = [''] * (max(enum.values()) + 1)
+    for name, value in enum.items():
+        names[value] = name
+    return tuple(names)
+
+
+TAG_NAMES = _name_table(Morpheme.Tag)
+"""품사 번호로 품사 이름을 찾는 표, `Morpheme.Tag.Name()` 을 대신합니다."""
+
+OOV_NAMES = _name_table(Morpheme.OutOfVocab)
+"""어휘 출처 번호로 이름을 찾는 표, `Morpheme.OutOfVocab.Name()` 을 대신합니다."""
+
+
+def tag_mask(tags: Union[int, str, Iterable[Union[int, str]]]) -> int:
+    """
+    품사들을 비트마스크로 변환합니다. 품사 번호 i 는 i 번째 비트입니다.
+
+    Args:
+        tags: 비트마스크, 품사 이름, 또는 품사 이름이나 번호의 목록
+
+    Raises:
+        ValueError: 알 수 없는 품사 이름이 있으면 에러를 발생시킵니다.
+
+    Returns:
+        int: 품사 비트마스크
+    """
+    if isinstance(tags, int):
+        return tags
+    if isinstance(tags, str):
+        tags = [tags]
+    mask = 0
+    for t in tags:
+        if isinstance(t, str):
+            t = Morpheme.Tag.Value(t)
+        mask |= 1 << t
+    return mask
+
+
+@lru_cache(maxsize=64)
+def mask_table(mask: int) -> Tuple[bool, ...]:
+    """
+    비트마스크를 품사 번호로 색인하는 참/거짓 표로 펼칩니다.
+    형태소마다 비트 연산을 하는 것보다 표를 찾는 것이 빠릅니다.
+
+    Args:
+        mask (int): 품사 비트마스크
+
+    Returns:
+        Tuple[bool, ...]: 품사 번호별 포함 여부
+    """
+    return tuple(bool(mask >> i & 1) for i in range(len(TAG_NAMES)))
+
+
+NOUNS = tag_mask(['NNG', 'NNP', 'NNB', 'NP'])
+VERBS = tag_mask(['VV'])
+PREDICATES = tag_mask(['VV', 'VA', 'VX', 'VCP', 'VCN'])
+PARTICLES = tag_mask(['JKS', 'JKC', 'JKG', 'JKO', 'JKB', 'JKV', 'JKQ', 'JX', 'JC'])
+ENDINGS = tag_mask(['EP', 'EF', 'EC', 'ETN', 'ETM'])
+SYMBOLS = tag_mask(['SF', 'SP', 'SS', 'SE', 'SO', 'SW'])
+ALL_TAGS = (1 << len(TAG_NAMES)) - 1
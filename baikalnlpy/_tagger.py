@@ -1,35 +1,101 @@
 # -*- coding: utf-8 -*-
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from sys import stdout
-from typing import IO, List, Any
+from typing import IO, Iterable, Iterator, List, Any, Set, Tuple, Union
 
+import grpc
 from google.protobuf.json_format import MessageToDict
 
 from baikalnlpy._custom_dict import CustomDict
 from baikalnlpy._lang_service_client import BaikalLanguageServiceClient
+from baikalnlpy._batch_control import AdaptiveBatchController, RETRYABLE_CODES
+from baikalnlpy._scheduler import RequestScheduler, BULK
+from baikalnlpy._routing import DomainRouter, FAILOVER_CODES
+from baikalnlpy._tag_set import TAG_NAMES, OOV_NAMES, NOUNS, VERBS, PARTICLES, ALL_TAGS, tag_mask, mask_table
 from baikal.language.language_service_pb2 import AnalyzeSyntaxResponse, Morpheme, Sentence, Token
 
 
+def shift_sentence(s: Sentence, delta: int):
+    """
+    move begin offsets of the sentence, its tokens and morphemes by delta.
+    :param s     : sentence message, changed in place.
+    :param delta : number of characters to move.
+    """
+    s.text.begin_offset += delta
+    for token in s.tokens:
+        token.text.begin_offset += delta
+        for m in token.morphemes:
+            m.text.begin_offset += delta
+
+
 class Tagged:
     """
     Tagged result.
     It has various output manipulations.
     """
 
-    def __init__(self, phrase: str, res: AnalyzeSyntaxResponse):
+    def __init__(self, phrase: str,
+                 res: Union[AnalyzeSyntaxResponse, bytes, List[Tuple[int, List[Sentence]]]]):
         """
         constructor, which is used internally.
         :param phrase: requested sentences.
-        :param res:
+        :param res: response message, or its serialized bytes,
+                    or a list of (base offset, sentences) pairs whose offsets are relative to the base.
+                    bytes are parsed lazily, when the message is first used.
+                    base offsets are added on read, the sentences are not copied nor changed
+                    until the whole message is asked for.
         """
         super().__init__()
         self.phrase = phrase
-        self.r = res
+        self._raw = None
+        self._r = None
+        self._segments = None
 
         # 빈 응답이 있는 경우를 대비해서 값이 없지 않도록 처리한다.
-        if self.r is None:
-            self.r = AnalyzeSyntaxResponse()
+        if res is None:
+            self._r = AnalyzeSyntaxResponse()
             self.phrase = ''
+        elif isinstance(res, bytes):
+            self._raw = res
+        elif isinstance(res, list):
+            self._segments = res
+        else:
+            self._r = res
+
+    @property
+    def r(self) -> AnalyzeSyntaxResponse:
+        if self._r is None:
+            if self._segments is not None:
+                r = AnalyzeSyntaxResponse()
+                for base, sentences in self._segments:
+                    for s in sentences:
+                        ns = r.sentences.add()
+                        ns.CopyFrom(s)
+                        shift_sentence(ns, base)
+                self._r = r
+            else:
+                self._r = AnalyzeSyntaxResponse.FromString(self._raw)
+        return self._r
+
+    def _walk(self) -> Iterator[Tuple[int, Sentence]]:
+        """
+        walk (base offset, sentence) pairs, without building the message from segments.
+        """
+        if self._r is None and self._segments is not None:
+            for base, sentences in self._segments:
+                for s in sentences:
+                    yield base, s
+        else:
+            for s in self.r.sentences:
+                yield 0, s
+
+    def parsed(self) -> bool:
+        """
+        :return: True if the message has been parsed.
+        """
+        return self._r is not None
 
     def msg(self) -> AnalyzeSyntaxResponse:
         """
@@ -37,6 +103,15 @@ class Tagged:
         """
         return self.r
 
+    def raw(self) -> bytes:
+        """
+        serialized message. if created from bytes, they are returned as they are, without parsing.
+        :return: serialized AnalyzeSyntaxResponse
+        """
+        if self._raw is not None:
+            return self._raw
+        return self.r.SerializeToString()
+
     def sentences(self) -> List[Sentence]:
         """
         :return: get sentences from tagged results.
@@ -75,18 +150,97 @@ class Tagged:
         if join:
             if detail:
                 p = f':{m.probability:5.3f}' if m.probability > 0 else ''
-                oov = f'#{Morpheme.OutOfVocab.Name(m.out_of_vocab)}' if m.out_of_vocab != 0 else ''
-                return f'{m.text.content}/{Morpheme.Tag.Name(m.tag)}{p}{oov}'
+                oov = f'#{OOV_NAMES[m.out_of_vocab]}' if m.out_of_vocab != 0 else ''
+                return f'{m.text.content}/{TAG_NAMES[m.tag]}{p}{oov}'
             else:
-                return f'{m.text.content}/{Morpheme.Tag.Name(m.tag)}'
+                return f'{m.text.content}/{TAG_NAMES[m.tag]}'
         else:
             if detail:
                 return m.text.content,\
-                       Morpheme.Tag.Name(m.tag),\
-                       Morpheme.OutOfVocab.Name(m.out_of_vocab),\
+                       TAG_NAMES[m.tag],\
+                       OOV_NAMES[m.out_of_vocab],\
                        m.probability
             else:
-                return m.text.content, Morpheme.Tag.Name(m.tag)
+                return m.text.content, TAG_NAMES[m.tag]
+
+    def _morphemes(self, mask: int = ALL_TAGS) -> Iterator[Morpheme]:
+        """
+        walk morphemes of all sentences, keeping ones whose tag is in the mask.
+        :param mask: tag bitmask, see `baikalnlpy._tag_set`.
+        """
+        if mask == ALL_TAGS:
+            for _, s in self._walk():
+                for token in s.tokens:
+                    yield from token.morphemes
+        else:
+            table = mask_table(mask)
+            for _, s in self._walk():
+                for token in s.tokens:
+                    for m in token.morphemes:
+                        if table[m.tag]:
+                            yield m
+
+    def _located(self) -> Iterator[Tuple[Morpheme, int, int]]:
+        """
+        walk all morphemes with their character offsets in the phrase.
+        the end offset is clamped to the enclosing token, since contracted morphemes
+        such as '아서' in '가서' are longer than the text they cover.
+        """
+        for base, s in self._walk():
+            for token in s.tokens:
+                token_end = base + token.text.begin_offset + len(token.text.content)
+                for m in token.morphemes:
+                    begin = base + m.text.begin_offset
+                    end = begin + len(m.text.content)
+                    yield m, begin, (end if end < token_end else token_end)
+
+    def select(self, tags: Union[int, str, Iterable] = None, with_offsets: bool = True) -> List:
+        """
+        select morphemes by tags.
+        :param tags         : tag bitmask such as `NOUNS | PREDICATES`, a tag name,
+                              or a list of tag names or ids. If None, all morphemes are returned.
+        :param with_offsets : If True, returns (morph, tag, begin, end),
+                              otherwise returns (morph, tag).
+                              offsets are character offsets in the phrase,
+                              clamped to the enclosing token.
+        """
+        mask = ALL_TAGS if tags is None else tag_mask(tags)
+        if with_offsets:
+            table = mask_table(mask)
+            return [(m.text.content, TAG_NAMES[m.tag], begin, end)
+                    for m, begin, end in self._located() if table[m.tag]]
+        else:
+            return [(m.text.content, TAG_NAMES[m.tag]) for m in self._morphemes(mask)]
+
+    def token_stream(self, tags: Union[int, str, Iterable] = None,
+                     stop_tags: Union[int, str, Iterable] = PARTICLES,
+                     stopwords: Set[str] = None,
+                     surface: bool = False) -> Iterator[Tuple[str, int, int, int, str]]:
+        """
+        analyzer token stream for search indexers.
+        yields (term, start, end, position increment, tag) tuples in one walk of the message.
+        offsets are character offsets in the phrase, clamped to the enclosing token.
+        position increment is 1 plus the number of morphemes removed just before.
+        :param tags      : tags to keep, as for `select()`. If None, all tags are kept.
+        :param stop_tags : tags to remove, particles by default. If None, nothing is removed.
+        :param stopwords : morphs to remove.
+        :param surface   : If True, term is the slice of the phrase, not the morph.
+        """
+        mask = ALL_TAGS if tags is None else tag_mask(tags)
+        if stop_tags is not None:
+            mask &= ~tag_mask(stop_tags)
+        keep = mask_table(mask)
+        phrase = self.phrase
+        names = TAG_NAMES
+        inc = 1
+        for m, start, end in self._located():
+            tag = m.tag
+            content = m.text.content
+            if not keep[tag] or (stopwords and content in stopwords):
+                inc += 1
+                continue
+            yield (phrase[start:end] if surface else content), start, end, inc, names[tag]
+            inc = 1
 
     def pos(self, flatten: bool = True, join: bool = False, detail: bool = False) -> List:
         """
@@ -96,33 +250,25 @@ class Tagged:
         :param detail  : if True, returns everything of morph result
         """
         if flatten:
-            return [Tagged._pos(m, join, detail) for s in self.r.sentences
-                    for token in s.tokens
-                    for m in token.morphemes]
+            if not join and not detail:
+                return self.select(with_offsets=False)
+            return [Tagged._pos(m, join, detail) for m in self._morphemes()]
         else:
             return [[Tagged._pos(m, join, detail) for m in token.morphemes]
-                    for s in self.r.sentences
+                    for _, s in self._walk()
                     for token in s.tokens]
 
     def morphs(self) -> List:
         """Parse phrase to morphemes."""
-        return [m.text.content for s in self.r.sentences
-                for token in s.tokens
-                for m in token.morphemes]
+        return [m.text.content for m in self._morphemes()]
 
     def nouns(self) -> List:
         """Noun extractor."""
-        return [m.text.content for s in self.r.sentences
-                for token in s.tokens
-                for m in token.morphemes
-                if m.tag in {Morpheme.Tag.NNP, Morpheme.Tag.NNG, Morpheme.Tag.NP, Morpheme.Tag.NNB}]
+        return [m.text.content for m in self._morphemes(NOUNS)]
 
     def verbs(self) -> List:
-        """Noun extractor."""
-        return [m.text.content for s in self.r.sentences
-                for token in s.tokens
-                for m in token.morphemes
-                if m.tag in {Morpheme.Tag.VV}]
+        """Verbs extractor."""
+        return [m.text.content for m in self._morphemes(VERBS)]
 
 
 class Tagger:
@@ -143,15 +289,31 @@ class Tagger:
     :param host         : str. host name for baikal nlp server
     :param port         : int. port  for baikal nlp server
     :param domain       : custom domain name for nlp request
+    :param scheduler    : RequestScheduler. If given, requests are queued by priority class.
+    :param channel      : grpc channel used instead of host and port,
+                          e.g. RecordingChannel or ReplayChannel.
+    :param endpoints    : List[str]. "host:port" of several servers used instead of host and port.
+                          each domain is served by its own `replicas` servers, see DomainRouter.
+    :param replicas     : int. number of servers owning a domain when endpoints are given.
+    :param spill        : If True, other servers are tried in turn when all owners are unavailable.
     """
 
-    def __init__(self, host: str = "", port: int = 5656, domain: str = ""):
+    def __init__(self, host: str = "", port: int = 5656, domain: str = "",
+                 scheduler: RequestScheduler = None, channel: grpc.Channel = None,
+                 endpoints: List[str] = None, replicas: int = 2, spill: bool = False):
 
         if host:
             host = host.strip()
         if domain:
             domain = domain.strip()
 
+        if channel is not None and endpoints:
+            raise ValueError("channel and endpoints cannot be used together.")
+        self.router = DomainRouter(endpoints, replicas, spill) if endpoints else None
+        if self.router is not None:
+            host, _, port = self.router.endpoints[0].rpartition(':')
+            port = int(port)
+
         if host == "" or host is None:
             self.host = 'nlp.baikal.ai'
         else:
@@ -164,8 +326,51 @@ class Tagger:
         self.domain = domain
 
         addr = self.host + ':' + str(self.port)
-        self.client = BaikalLanguageServiceClient(addr)
+        self.channel = channel
+        self.client = BaikalLanguageServiceClient(addr, channel)
+        self.clients = {addr: self.client}
         self.custom_dicts = {}
+        self.scheduler = scheduler
+
+    def _call(self, content: str, auto_split: bool, timeout: float, raw: bool):
+        """
+        call the server owning the domain, or the single server without a router.
+        on UNAVAILABLE the request fails over to the next server of the route.
+        timeout covers all attempts, each attempt gets only the time that remains.
+        """
+        if self.router is None:
+            call = self.client.analyze_syntax_raw if raw else self.client.analyze_syntax
+            return call(content, self.domain, auto_split, timeout=timeout)
+        route = self.router.route(self.domain)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for i, remote in enumerate(route):
+            if deadline is not None:
+                timeout = max(deadline - time.monotonic(), 0.0)
+            client = self.clients.get(remote)
+            if client is None:
+                client = self.clients.setdefault(remote, BaikalLanguageServiceClient(remote))
+            call = client.analyze_syntax_raw if raw else client.analyze_syntax
+            try:
+                return call(content, self.domain, auto_split, timeout=timeout)
+            except grpc.RpcError as e:
+                if i == len(route) - 1 or e.code() not in FAILOVER_CODES:
+                    raise
+
+    def _analyze(self, content: str, auto_split: bool, priority: str = None,
+                 timeout: float = None, raw: bool = False):
+        """
+        call the server, waiting for a scheduler slot if a scheduler is set.
+        :param priority : priority class of the scheduler.
+        :param timeout  : seconds, used both as the deadline in the queue and for the call.
+        :param raw      : If True, returns serialized bytes.
+        """
+        if self.scheduler is None:
+            return self._call(content, auto_split, timeout, raw)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.scheduler.slot(priority, deadline):
+            if deadline is not None:
+                timeout = max(deadline - time.monotonic(), 0.0)
+            return self._call(content, auto_split, timeout, raw)
 
     def set_domain(self, domain: str):
         """
@@ -182,28 +387,156 @@ class Tagger:
         if domain in self.custom_dicts:
             return self.custom_dicts[domain]
         else:
-            self.custom_dicts[domain] = CustomDict(domain, self.host, self.port)
+            remotes = self.router.owners(domain) if self.router is not None else None
+            self.custom_dicts[domain] = CustomDict(domain, self.host, self.port, self.channel, remotes)
             return self.custom_dicts[domain]
 
-    def tag(self, phrase: str, auto_split: bool = False) -> Tagged:
+    def tag(self, phrase: str, auto_split: bool = False,
+            priority: str = None, timeout: float = None) -> Tagged:
         if len(phrase) is 0:
             print("OOPS, no sentences.")
             return Tagged('', AnalyzeSyntaxResponse())
         return Tagged(phrase,
-                      self.client.analyze_syntax(phrase, self.domain, auto_split))
+                      self._analyze(phrase, auto_split, priority, timeout))
 
-    def tags(self, phrase: List[str]) -> Tagged:
+    def tag_raw(self, phrase: str, auto_split: bool = False,
+                priority: str = None, timeout: float = None) -> Tagged:
+        """
+        tag without parsing the response.
+        the returned Tagged keeps serialized bytes, `raw()` returns them as they are,
+        and the message is parsed only when other methods such as `pos()` are used.
+        :param phrase     : string to analyse
+        :param auto_split : If True, the server splits sentences.
+        :param priority   : priority class, used if a scheduler is set.
+        :param timeout    : seconds
+        :return: Tagged result instance
+        """
+        if len(phrase) == 0:
+            print("OOPS, no sentences.")
+            return Tagged('', AnalyzeSyntaxResponse())
+        return Tagged(phrase,
+                      self._analyze(phrase, auto_split, priority, timeout, raw=True))
+
+    def tags(self, phrase: List[str], priority: str = None, timeout: float = None) -> Tagged:
         """
         tag string array.
-        :param phrase: array of string
+        with a scheduler, long arrays are sent in chunks of `scheduler.chunk_chars`
+        so that higher priority requests can go in between, and the results are merged.
+        :param phrase   : array of string
+        :param priority : priority class, used if a scheduler is set.
+        :param timeout  : seconds, for each request.
         :return: Tagged result instance
         """
         if len(phrase) is 0:
             print("OOPS, no sentences.")
             return Tagged('', AnalyzeSyntaxResponse())
         p = '\n'.join(phrase)
-        return Tagged(p,
-                      self.client.analyze_syntax(p, self.domain, auto_split=False))
+        if self.scheduler is None or len(p) <= self.scheduler.chunk_chars:
+            return Tagged(p,
+                          self._analyze(p, False, priority, timeout))
+
+        res = AnalyzeSyntaxResponse()
+        base = 0
+        chunk = []
+        size = 0
+        for i, ph in enumerate(phrase):
+            chunk.append(ph)
+            size += len(ph) + 1
+            if size >= self.scheduler.chunk_chars or i == len(phrase) - 1:
+                c = '\n'.join(chunk)
+                r = self._analyze(c, False, priority, timeout)
+                for s in r.sentences:
+                    shift_sentence(s, base)
+                res.sentences.extend(r.sentences)
+                base += len(c) + 1
+                chunk = []
+                size = 0
+        return Tagged(p, res)
+
+    def _tag_batch(self, batch: '_Batch', auto_split: bool, timeout: float, priority: str):
+        p = '\n'.join(batch.phrases)
+        start = time.monotonic()
+        res = self._analyze(p, auto_split, priority, timeout)
+        return Tagged(p, res), time.monotonic() - start
+
+    def bulk_tags(self, phrases: Iterable[str], auto_split: bool = False,
+                  controller: AdaptiveBatchController = None,
+                  priority: str = None) -> Iterator[Tagged]:
+        """
+        tag a large stream of strings in batches, adapting batch size and in-flight requests.
+        each batch is joined with newlines as `tags()` does, and results are yielded in input order.
+        batches failing with RESOURCE_EXHAUSTED, DEADLINE_EXCEEDED or UNAVAILABLE are split
+        and retried up to `controller.max_retries` times.
+        :param phrases    : iterable of string, trailing newlines are removed. e.g. a file object.
+        :param auto_split : If True, the server splits sentences.
+        :param controller : adaptive controller, if None a default one is used.
+        :param priority   : priority class, used if a scheduler is set.
+                            defaults to 'bulk' if the scheduler has the class.
+        :return: iterator of Tagged, one per batch.
+        """
+        ctl = controller if controller is not None else AdaptiveBatchController()
+        if priority is None and self.scheduler is not None and BULK in self.scheduler.limits:
+            priority = BULK
+        source = (p.rstrip('\r\n') for p in phrases)
+        carry = []
+        exhausted = False
+
+        def next_batch():
+            nonlocal exhausted
+            batch = _Batch()
+            limit = ctl.batch_bytes
+            while not exhausted:
+                if carry:
+                    p = carry.pop()
+                else:
+                    p = next(source, None)
+                    if p is None:
+                        exhausted = True
+                        break
+                size = len(p.encode('utf-8')) + 1
+                if batch.phrases and batch.size + size > limit:
+                    carry.append(p)
+                    break
+                batch.phrases.append(p)
+                batch.size += size
+            return batch if batch.phrases else None
+
+        slots = []
+        retries = []
+        in_flight = {}
+        ctl.begin()
+        with ThreadPoolExecutor(max_workers=ctl.max_concurrency) as pool:
+            while True:
+                while len(in_flight) < ctl.concurrency:
+                    if retries:
+                        batch = retries.pop(0)
+                    else:
+                        batch = next_batch()
+                        if batch is None:
+                            break
+                        slots.append(batch)
+                    in_flight[pool.submit(self._tag_batch, batch, auto_split, ctl.timeout, priority)] = batch
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for f in done:
+                    batch = in_flight.pop(f)
+                    try:
+                        batch.result, latency = f.result()
+                        ctl.record_success(sum(len(p) for p in batch.phrases), latency)
+                    except grpc.RpcError as e:
+                        code = e.code() if hasattr(e, 'code') else None
+                        ctl.record_failure(code)
+                        if code not in RETRYABLE_CODES or batch.attempts >= ctl.max_retries:
+                            for pending in in_flight:
+                                pending.cancel()
+                            raise e
+                        parts = batch.split()
+                        i = slots.index(batch)
+                        slots[i:i + 1] = parts
+                        retries[0:0] = parts
+                while slots and slots[0].result is not None:
+                    yield slots.pop(0).result
 
     def pos(self, phrase: str, flatten: bool = True, join: bool = False, detail: bool = False) -> List:
         """
@@ -226,3 +559,25 @@ class Tagger:
     def verbs(self, phrase: str) -> List:
         """Verbs extractor."""
         return self.tag(phrase).verbs()
+
+
+class _Batch:
+    """a batch of phrases for `Tagger.bulk_tags()`."""
+    __slots__ = ('phrases', 'size', 'attempts', 'result')
+
+    def __init__(self, phrases: List[str] = None, size: int = 0, attempts: int = 0):
+        self.phrases = phrases if phrases is not None else []
+        self.size = size
+        self.attempts = attempts
+        self.result = None
+
+    def split(self) -> List['_Batch']:
+        """halve the batch for retry, or retry it as it is if it has only one phrase."""
+        n = len(self.phrases)
+        if n < 2:
+            return [_Batch(self.phrases, self.size, self.attempts + 1)]
+        half = n // 2
+        first = self.phrases[:half]
+        size = sum(len(p.encode('utf-8')) + 1 for p in first)
+        return [_Batch(first, size, self.attempts + 1),
+                _Batch(self.phrases[half:], self.size - size, self.attempts + 1)]
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+import struct
+import threading
+import time
+from typing import Dict, Tuple, Union
+
+import grpc
+from google.protobuf.message import Message
+
+from baikalnlpy._lang_service_client import MAX_MESSAGE_LENGTH
+
+_MAGIC = b'BKRR1\n'
+# 메소드 길이, 요청 길이, 응답 길이, 기록된 지연(초)
+_HEADER = struct.Struct('<HIIf')
+
+
+def _open_channel(remote: str) -> grpc.Channel:
+    return grpc.insecure_channel(
+        remote,
+        options=[
+            ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
+            ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
+        ])
+
+
+def _request_bytes(request, serializer) -> bytes:
+    # map 필드의 순서는 PYTHONHASHSEED 에 따라 바뀌므로, 기록과 재생에서 같은 키가 되도록
+    # protobuf 메시지는 결정적으로 직렬화한다.
+    if isinstance(request, Message):
+        return request.SerializeToString(deterministic=True)
+    return serializer(request) if serializer else request
+
+
+class ReplayError(grpc.RpcError):
+    """
+    재생 중에 발생하는 에러.
+    기록에 없는 요청은 NOT_FOUND, 흉내낸 지연이 제한 시간을 넘으면 DEADLINE_EXCEEDED 입니다.
+    """
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self._code = code
+        self._details = details
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+
+class _RecordingCallable:
+    def __init__(self, owner: 'RecordingChannel', method: str, request_serializer, response_deserializer):
+        self._owner = owner
+        self._method = method
+        self._call = owner.channel.unary_unary(method)
+        self._serialize = request_serializer
+        self._deserialize = response_deserializer
+
+    def __call__(self, request, timeout=None, metadata=None, credentials=None, **kwargs):
+        req = _request_bytes(request, self._serialize)
+        start = time.monotonic()
+        res = self._call(req, timeout=timeout, metadata=metadata, credentials=credentials)
+        self._owner.write(self._method, req, res, time.monotonic() - start)
+        return self._deserialize(res) if self._deserialize else res
+
+
+class RecordingChannel:
+    """
+    실제 서버를 부르면서 요청과 응답을 파일에 기록하는 채널.
+
+    `BaikalLanguageServiceClient`, `CustomDictionaryServiceClient`, `Tagger`, `CustomDict` 의
+    channel 인자로 넘기면 됩니다. 요청과 응답은 직렬화된 바이트 그대로 길이를 앞에 붙여 씁니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> with bn.RecordingChannel('nlp.baikal.ai:5656', 'session.bkrr') as ch:
+        ...     bn.Tagger(channel=ch).pos('오늘은 정말 추운 날이네요.')
+    """
+
+    def __init__(self, remote: Union[str, grpc.Channel], path: str):
+        """
+        Args:
+            remote (Union[str, grpc.Channel]): 원격 주소 또는 이미 연 채널
+            path (str): 기록할 파일 이름, 이미 있으면 덮어씁니다.
+        """
+        self.channel = _open_channel(remote) if isinstance(remote, str) else remote
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(_MAGIC)
+        self._lock = threading.Lock()
+        self.records = 0
+
+    def unary_unary(self, method: str, request_serializer=None, response_deserializer=None, **kwargs):
+        return _RecordingCallable(self, method, request_serializer, response_deserializer)
+
+    def write(self, method: str, request: bytes, response: bytes, latency: float):
+        """요청과 응답 한 쌍을 기록합니다."""
+        m = method.encode('utf-8')
+        with self._lock:
+            self._file.write(_HEADER.pack(len(m), len(request), len(response), latency))
+            self._file.write(m)
+            self._file.write(request)
+            self._file.write(response)
+            self.records += 1
+
+    def close(self):
+        """기록 파일을 닫습니다."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def read_records(path: str):
+    """
+    기록 파일을 읽습니다.
+
+    Args:
+        path (str): 기록 파일 이름
+
+    Raises:
+        ValueError: 기록 파일이 아니거나 잘려 있으면 에러를 발생시킵니다.
+
+    Returns:
+        Iterator: (메소드, 요청 바이트, 응답 바이트, 지연)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(_MAGIC):
+        raise ValueError(f"{path} is not a baikalnlpy recording.")
+    pos = len(_MAGIC)
+    view = memoryview(data)
+    while pos < len(data):
+        if pos + _HEADER.size > len(data):
+            raise ValueError(f"{path} is truncated.")
+        ml, ql, rl, latency = _HEADER.unpack_from(data, pos)
+        pos += _HEADER.size
+        if pos + ml + ql + rl > len(data):
+            raise ValueError(f"{path} is truncated.")
+        method = bytes(view[pos:pos + ml]).decode('utf-8')
+        pos += ml
+        req = bytes(view[pos:pos + ql])
+        pos += ql
+        res = bytes(view[pos:pos + rl])
+        pos += rl
+        yield method, req, res, latency
+
+
+class _ReplayCallable:
+    def __init__(self, owner: 'ReplayChannel', method: str, request_serializer, response_deserializer):
+        self._owner = owner
+        self._method = method
+        self._serialize = request_serializer
+        self._deserialize = response_deserializer
+
+    def __call__(self, request, timeout=None, metadata=None, credentials=None, **kwargs):
+        req = _request_bytes(request, self._serialize)
+        res = self._owner.lookup(self._method, req, timeout)
+        return self._deserialize(res) if self._deserialize else res
+
+
+class ReplayChannel:
+    """
+    기록 파일의 응답을 돌려주는 채널, 네트워크를 쓰지 않습니다.
+
+    요청은 메소드와 직렬화된 요청 바이트로 찾습니다. 같은 요청이 여러 번 기록되어 있으면
+    처음 기록을 씁니다. 기록에 없는 요청은 NOT_FOUND 상태의 `ReplayError` 를 발생시킵니다.
+
+    .. code-block:: python
+        >>> import baikalnlpy as bn
+        >>> tagger = bn.Tagger(channel=bn.ReplayChannel('session.bkrr', latency='recorded'))
+        >>> tagger.pos('오늘은 정말 추운 날이네요.')
+    """
+
+    def __init__(self, path: str, latency: Union[float, str, None] = None):
+        """
+        Args:
+            path (str): 기록 파일 이름
+            latency (Union[float, str, None], optional): 응답 전에 흉내낼 지연.
+                초 단위 숫자, 기록된 지연을 쓰려면 'recorded', 지연 없이는 None.
+        Raises:
+            ValueError: latency 값이 잘못되면 에러를 발생시킵니다.
+        """
+        if latency is not None and latency != 'recorded' and not isinstance(latency, (int, float)):
+            raise ValueError("latency must be seconds, 'recorded' or None.")
+        self.path = path
+        self.latency = latency
+        self.index: Dict[Tuple[str, bytes], Tuple[bytes, float]] = {}
+        for method, req, res, lat in read_records(path):
+            self.index.setdefault((method, req), (res, lat))
+        self.hits = 0
+        self.misses = 0
+
+    def unary_unary(self, method: str, request_serializer=None, response_deserializer=None, **kwargs):
+        return _ReplayCallable(self, method, request_serializer, response_deserializer)
+
+    def lookup(self, method: str, request: bytes, timeout: float = None) -> bytes:
+        """
+        기록된 응답을 찾습니다.
+
+        Args:
+            method (str): gRPC 메소드 경로
+            request (bytes): 직렬화된 요청
+            timeout (float, optional): 요청 제한 시간(초)
+
+        Raises:
+            ReplayError: 기록에 없는 요청이거나, 흉내낸 지연이 제한 시간을 넘으면 에러를 발생시킵니다.
+
+        Returns:
+            bytes: 직렬화된 응답
+        """
+        found = self.index.get((method, request))
+        if found is None:
+            self.misses += 1
+            raise ReplayError(grpc.StatusCode.NOT_FOUND, f'no recorded response for {method}')
+        self.hits += 1
+        res, recorded = found
+        delay = recorded if self.latency == 'recorded' else self.latency
+        if delay:
+            if timeout is not None and delay > timeout:
+                time.sleep(timeout)
+                raise ReplayError(grpc.StatusCode.DEADLINE_EXCEEDED, 'Deadline Exceeded')
+            time.sleep(delay)
+        return res
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index)
@@ -55,6 +55,9 @@ setuptools.setup(
     license='BSD',
     platform='Independent',
     packages=setuptools.find_packages(),
+    entry_points={
+        'console_scripts': ['baikalnlpy=baikalnlpy.__main__:main'],
+    },
     classifiers=[_f for _f in CLASSIFIERS.split('\n') if _f],
     python_requires='>=3.6',
 )
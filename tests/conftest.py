@@ -0,0 +1,170 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import pytest
+
+from baikalnlpy._loadtest import StandInLanguageService
+
+
+def build_response(phrase: str, sentences):
+    """
+    서버 없이 형태소 분석 결과를 만듭니다.
+
+    sentences 는 문장의 목록이고, 문장은 어절의 목록이며,
+    어절은 (어절 시작 위치, [(형태소, 품사, 시작 위치), ...]) 형식입니다.
+    """
+    from baikal.language.language_service_pb2 import AnalyzeSyntaxResponse, Morpheme
+
+    res = AnalyzeSyntaxResponse()
+    for tokens in sentences:
+        s = res.sentences.add()
+        begin = tokens[0][0]
+        last = tokens[-1]
+        end = last[0] + len(_token_text(phrase, tokens, len(tokens) - 1))
+        s.text.content = phrase[begin:end]
+        s.text.begin_offset = begin
+        for i, (offset, morphs) in enumerate(tokens):
+            t = s.tokens.add()
+            t.text.content = _token_text(phrase, tokens, i)
+            t.text.begin_offset = offset
+            t.tagged = '+'.join(f'{m}/{tag}' for m, tag, _ in morphs)
+            for m, tag, m_offset in morphs:
+                pm = t.morphemes.add()
+                pm.text.content = m
+                pm.text.begin_offset = m_offset
+                pm.tag = Morpheme.Tag.Value(tag)
+                pm.probability = 0.9
+    return res
+
+
+def _token_text(phrase: str, tokens, i: int) -> str:
+    offset = tokens[i][0]
+    end = phrase.find(' ', offset)
+    if end < 0:
+        end = len(phrase)
+    nl = phrase.find('\n', offset)
+    if 0 <= nl < end:
+        end = nl
+    return phrase[offset:end]
+
+
+SAMPLE1_TOKENS = [
+    (0, [('오늘', 'NNG', 0), ('은', 'JX', 2)]),
+    (4, [('정말', 'MAG', 4)]),
+    (7, [('춥', 'VA', 7), ('ㄴ', 'ETM', 8)]),
+    (10, [('날', 'NNG', 10), ('이', 'VCP', 11), ('네', 'EF', 12), ('요', 'JX', 13), ('.', 'SF', 14)]),
+]
+
+
+@pytest.fixture
+def offline_sample1():
+    return '오늘은 정말 추운 날이네요.'
+
+
+@pytest.fixture
+def offline_tagged(offline_sample1):
+    from baikalnlpy import Tagged
+    return Tagged(offline_sample1, build_response(offline_sample1, [SAMPLE1_TOKENS]))
+
+
+@pytest.fixture
+def offline_contracted():
+    """'아서/EC' 처럼 형태소가 어절의 글자보다 긴 결과"""
+    from baikalnlpy import Tagged
+    phrase = '가서 보다'
+    return Tagged(phrase, build_response(phrase, [[
+        (0, [('가', 'VV', 0), ('아서', 'EC', 1)]),
+        (3, [('보', 'VV', 3), ('다', 'EF', 4)]),
+    ]]))
+
+
+class FakeLanguageService(StandInLanguageService):
+    """
+    어절마다 NNG 형태소 하나를 돌려주는 가짜 형태소 분석 서버.
+    받은 요청을 requests 에 모으고, fail_codes 에 상태 코드를 넣으면 그 순서대로 실패합니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.peers = set()
+        self.fail_codes = []
+
+    def AnalyzeSyntax(self, request, context):
+        self.requests.append(request)
+        self.peers.add(context.peer())
+        if self.fail_codes:
+            context.abort(self.fail_codes.pop(0), 'fake failure')
+        return super().AnalyzeSyntax(request, context)
+
+
+class FakeCustomDictionaryService:
+    """
+    받은 사용자 사전을 메모리에 보관하는 가짜 사용자 사전 서버.
+    """
+
+    def __init__(self):
+        self.dicts = {}
+
+    def GetCustomDictionaryList(self, request, context):
+        import baikal.language.custom_dict_pb2 as pb
+        res = pb.GetCustomDictionaryListResponse()
+        for name in self.dicts:
+            res.domain_dicts.add().domain_name = name
+        return res
+
+    def GetCustomDictionary(self, request, context):
+        import grpc
+        import baikal.language.custom_dict_pb2 as pb
+        if request.domain_name not in self.dicts:
+            context.abort(grpc.StatusCode.NOT_FOUND, 'no such domain')
+        res = pb.GetCustomDictionaryResponse()
+        res.dict.CopyFrom(self.dicts[request.domain_name])
+        return res
+
+    def UpdateCustomDictionary(self, request, context):
+        import baikal.language.custom_dict_pb2 as pb
+        self.dicts[request.domain_name] = request.dict
+        return pb.UpdateCustomDictionaryResponse(updated_domain_name=request.domain_name)
+
+    def RemoveCustomDictionaries(self, request, context):
+        import baikal.language.custom_dict_pb2 as pb
+        res = pb.RemoveCustomDictionariesResponse()
+        names = list(self.dicts) if request.all else list(request.domain_names)
+        for name in names:
+            res.deleted_domain_names[name] = self.dicts.pop(name, None) is not None
+        return res
+
+
+@pytest.fixture
+def fake_server_factory():
+    from concurrent import futures
+    import grpc
+    from baikal.language.language_service_pb2_grpc import add_LanguageServiceServicer_to_server
+    from baikal.language.custom_dict_pb2_grpc import add_CustomDictionaryServiceServicer_to_server
+    from baikalnlpy._lang_service_client import MAX_MESSAGE_LENGTH
+    servers = []
+
+    def start():
+        servicer = FakeLanguageService()
+        servicer.custom_dict = FakeCustomDictionaryService()
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=8),
+                             options=[
+                                 ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
+                                 ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
+                             ])
+        add_LanguageServiceServicer_to_server(servicer, server)
+        add_CustomDictionaryServiceServicer_to_server(servicer.custom_dict, server)
+        servicer.port = server.add_insecure_port('localhost:0')
+        servicer.server = server
+        server.start()
+        servers.append(server)
+        return servicer
+
+    yield start
+    for server in servers:
+        server.stop(None)
+
+
+@pytest.fixture
+def fake_server(fake_server_factory):
+    return fake_server_factory()
@@ -0,0 +1,45 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import grpc
+
+
+def test_controller_aimd():
+    import baikalnlpy as bn
+    ctl = bn.AdaptiveBatchController(batch_bytes=4096, min_batch_bytes=1024, increase_bytes=1024,
+                                     concurrency=1, target_latency=0.5)
+    ctl.begin()
+    ctl.record_success(100, 0.1)
+    assert ctl.batch_bytes == 5120
+    assert ctl.concurrency == 2
+    ctl.record_success(100, 0.9)
+    assert ctl.batch_bytes == 2560
+    assert ctl.concurrency == 2
+    ctl.record_failure(grpc.StatusCode.UNAVAILABLE)
+    assert ctl.batch_bytes == 1280
+    assert ctl.concurrency == 1
+    settings = ctl.settings()
+    assert settings['requests'] == 2
+    assert settings['failures'] == 1
+    assert settings['throughput'] > 0
+
+
+def test_tagger_bulk_tags(fake_server):
+    import baikalnlpy as bn
+    tagger = bn.Tagger('localhost', fake_server.port)
+    lines = [f'문장 {i} 입니다\n' for i in range(200)]
+    ctl = bn.AdaptiveBatchController(batch_bytes=1024, min_batch_bytes=256, increase_bytes=512)
+    results = list(tagger.bulk_tags(lines, controller=ctl))
+    assert len(results) > 1
+    assert '\n'.join(r.phrase for r in results) == ''.join(lines).rstrip('\n')
+    assert sum(len(r.sentences()) for r in results) == 200
+    assert ctl.settings()['batch_bytes'] > 1024
+
+
+def test_tagger_bulk_tags_retry(fake_server):
+    import baikalnlpy as bn
+    fake_server.fail_codes = [grpc.StatusCode.RESOURCE_EXHAUSTED]
+    tagger = bn.Tagger('localhost', fake_server.port)
+    ctl = bn.AdaptiveBatchController(concurrency=1)
+    results = list(tagger.bulk_tags(['하나', '둘', '셋'], controller=ctl))
+    assert [r.phrase for r in results] == ['하나', '둘\n셋']
+    assert ctl.settings()['failures'] == 1
@@ -0,0 +1,43 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import pickle
+
+
+def test_corpus_stats_counts(offline_tagged):
+    import baikalnlpy as bn
+    stats = bn.CorpusStats()
+    stats.add(offline_tagged)
+    stats.add(offline_tagged.msg())
+    assert stats.sentences == 2
+    assert stats.tokens == 8
+    assert stats.morphemes == 20
+    assert stats.nouns.most_common() == [('오늘', 2), ('날', 2)]
+    assert len(stats.verbs) == 0
+    assert stats.pos_distribution()['NNG'] == 0.2
+    assert stats.oov_distribution() == {'IN_WORD_EMBEDDING': 20}
+    assert stats.oov_rate() == 0.0
+    assert abs(stats.mean_probability() - 0.9) < 1e-6
+
+
+def test_corpus_stats_merge(offline_tagged):
+    import baikalnlpy as bn
+    a = bn.CorpusStats().update([offline_tagged])
+    b = pickle.loads(pickle.dumps(bn.CorpusStats().update([offline_tagged] * 2)))
+    a.merge(b)
+    assert a.sentences == 3
+    assert a.nouns['오늘'] == 3
+
+
+def test_heavy_hitters_bounded():
+    import baikalnlpy as bn
+    hh = bn.HeavyHitters(capacity=2)
+    for w in ['a'] * 10 + ['b'] * 5 + ['c', 'd', 'e']:
+        hh.add(w)
+    assert len(hh) <= 2
+    assert hh.most_common(1)[0][0] == 'a'
+    assert hh['a'] >= 10 - hh.error
+    other = bn.HeavyHitters(capacity=2)
+    other.add('b', 20)
+    hh.merge(other)
+    assert hh.most_common(1)[0][0] == 'b'
+    assert hh.total == 38
@@ -0,0 +1,39 @@
+#!env python3
+# -*- coding: utf-8 -*-
+
+
+def _dict(domain, np=(), cp=(), cp_caret=()):
+    import baikalnlpy as bn
+    cd = bn.CustomDict(domain, 'localhost', 0)
+    cd.copy_np_set(set(np))
+    cd.copy_cp_set(set(cp))
+    cd.copy_cp_caret_set(set(cp_caret))
+    return cd
+
+
+def test_dict_index_scan():
+    from baikalnlpy import DictEntry
+    cd = _dict('ai', np={'인공지능'}, cp={'지능'}, cp_caret={'자연어^처리^엔진', '자연어^처리'})
+    index = cd.build_index()
+    text = '인공지능 기반 자연어처리엔진'
+    matches = [(m.start, m.end, m.entry) for m in index.scan(text)]
+    assert matches == [(0, 4, DictEntry('ai', 'np', '인공지능')),
+                       (2, 4, DictEntry('ai', 'cp', '지능')),
+                       (8, 13, DictEntry('ai', 'cp_caret', '자연어^처리')),
+                       (8, 15, DictEntry('ai', 'cp_caret', '자연어^처리^엔진'))]
+    assert [text[m.start:m.end] for m in index.scan(text)] == ['인공지능', '지능', '자연어처리', '자연어처리엔진']
+
+
+def test_dict_index_route_coverage():
+    import baikalnlpy as bn
+    index = bn.DictIndex.from_dicts([
+        _dict('law', np={'대법원', '헌법재판소'}, cp={'근저당권'}),
+        _dict('covid', cp={'코로나19', 'K방역'}),
+    ])
+    assert index.route('대법원은 근저당권 설정을 인정했다.') == 'law'
+    assert index.domain_hits('코로나19 이후 K방역과 대법원') == {'covid': 2, 'law': 1}
+    assert index.route('아무것도 없다', default='') == ''
+    cov = index.coverage()
+    assert cov['law'] == {'entries': 3, 'used': 2, 'hits': 3, 'ratio': 2 / 3}
+    assert cov['covid']['ratio'] == 1.0
+    assert [e.word for e in index.unused()] == ['헌법재판소']
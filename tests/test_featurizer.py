@@ -0,0 +1,43 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import pytest
+
+
+def test_vectorizer_fitted(offline_tagged):
+    import baikalnlpy as bn
+    vec = bn.MorphemeVectorizer(tags=bn.NOUNS | bn.PREDICATES)
+    vec.fit([offline_tagged])
+    assert vec.vocabulary == {('오늘', 24): 0, ('춥', 38): 1, ('날', 24): 2, ('이', 40): 3}
+    data, indices, indptr, shape = vec.transform_arrays([offline_tagged, offline_tagged.msg()])
+    assert shape == (2, 4)
+    assert list(indptr) == [0, 4, 8]
+    assert list(indices[:4]) == [0, 1, 2, 3]
+    assert list(data) == [1.0] * 8
+
+
+def test_vectorizer_ngrams(offline_tagged):
+    import baikalnlpy as bn
+    vec = bn.MorphemeVectorizer(unit='morph', ngram_range=(2, 2)).fit([offline_tagged])
+    assert ('오늘', '은') in vec.vocabulary
+    assert len(vec.vocabulary) == 9
+    lemma = bn.MorphemeVectorizer(unit='lemma').fit([offline_tagged])
+    assert '날이네요.' in lemma.vocabulary
+
+
+def test_vectorizer_hashed(offline_tagged):
+    import baikalnlpy as bn
+    vec = bn.MorphemeVectorizer(ngram_range=(1, 2), n_features=1 << 20, binary=True)
+    data, indices, indptr, shape = vec.transform_arrays([offline_tagged])
+    assert shape == (1, 1 << 20)
+    assert indptr[-1] == 19
+    again = vec.transform_arrays([offline_tagged])
+    assert list(again[1]) == list(indices)
+
+
+def test_vectorizer_csr(offline_tagged):
+    pytest.importorskip('scipy')
+    import baikalnlpy as bn
+    vec = bn.MorphemeVectorizer().fit([offline_tagged])
+    chunks = list(vec.transform_chunks([offline_tagged] * 3, chunk_size=2))
+    assert [c.shape for c in chunks] == [(2, 9), (1, 9)]
+    assert chunks[0].sum() == 20
@@ -0,0 +1,51 @@
+#!env python3
+# -*- coding: utf-8 -*-
+
+
+def test_split_segments():
+    from baikalnlpy._incremental import split_segments
+    doc = '첫 문장입니다. 둘째 문장!\n\n  셋째 줄  \n'
+    assert [doc[b:e] for b, e in split_segments(doc)] == ['첫 문장입니다.', '둘째 문장!', '셋째 줄']
+
+
+def test_incremental_tagger(fake_server):
+    import baikalnlpy as bn
+    inc = bn.IncrementalTagger(bn.Tagger('localhost', fake_server.port))
+    doc = '하늘이 맑다. 바람이 분다.\n강물이 흐른다.'
+    tagged = inc.tag(doc)
+    assert fake_server.requests[-1].document.content == '하늘이 맑다.\n바람이 분다.\n강물이 흐른다.'
+    assert [doc[b:e] for _, _, b, e in tagged.select()] == tagged.morphs()
+
+    edited = '하늘이 맑다. 구름이 간다.\n강물이 흐른다.'
+    tagged = inc.tag(edited)
+    assert len(fake_server.requests) == 2
+    assert fake_server.requests[-1].document.content == '구름이 간다.'
+    assert tagged.morphs() == ['하늘이', '맑다.', '구름이', '간다.', '강물이', '흐른다.']
+    assert [edited[b:e] for _, _, b, e in tagged.select()] == tagged.morphs()
+    assert [s.text.begin_offset for s in tagged.sentences()] == [0, 8, 16]
+
+    inc.tag(edited)
+    assert len(fake_server.requests) == 2
+    assert '바람이 분다.' not in inc.cache
+
+
+def test_incremental_edit_work(fake_server, monkeypatch):
+    import baikalnlpy as bn
+    import baikalnlpy._incremental as incremental
+    inc = bn.IncrementalTagger(bn.Tagger('localhost', fake_server.port))
+    doc = '\n'.join(f'문장 {i} 입니다.' for i in range(500))
+    inc.tag(doc)
+
+    shifted = []
+    monkeypatch.setattr(incremental, 'shift_sentence', lambda s, delta: shifted.append(delta))
+    edited = doc.replace('문장 250 입니다.', '고친 문장 250 입니다.')
+    tagged = inc.tag(edited)
+    # 새 구간의 문장만 고치고, 보관한 문장은 복사하지 않는다.
+    assert len(shifted) == 1
+    assert not tagged.parsed()
+    sel = tagged.select()
+    assert [edited[b:e] for _, _, b, e in sel] == tagged.morphs()
+    assert not tagged.parsed()
+    assert len(tagged.sentences()) == 500
+    assert tagged.parsed()
+    assert inc.cache['문장 0 입니다.'][0].text.begin_offset == 0
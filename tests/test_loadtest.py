@@ -0,0 +1,60 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+
+@pytest.fixture
+def stand_in():
+    from baikalnlpy._loadtest import start_stand_in
+    server = start_stand_in()
+    yield f'localhost:{server.bound_port}'
+    server.stop(None)
+
+
+def test_loadtest_closed(stand_in):
+    from baikalnlpy._loadtest import LoadTest
+    report = LoadTest([stand_in], ['하나 둘', '', '셋 넷 다섯'], concurrency=2,
+                      size='uniform:1:3', requests=20, duration=10, seed=1).run()
+    assert report['requests'] == 20
+    assert report['errors'] == 0
+    assert report['chars'] > 0
+    assert 0 < report['latency']['p50'] <= report['latency']['p99'] <= report['latency']['max']
+    json.dumps(report)
+
+
+def test_loadtest_open_with_errors(stand_in):
+    from baikalnlpy._loadtest import LoadTest
+    report = LoadTest([stand_in, 'localhost:1'], ['가 나'], mode='open', rate=50,
+                      duration=0.3, timeout=2).run()
+    assert report['requests'] > 2
+    assert report['errors_by_code'].get('UNAVAILABLE', 0) > 0
+    assert 0 < report['error_rate'] < 1
+
+
+def test_loadtest_large_requests(stand_in):
+    from baikalnlpy._loadtest import LoadTest
+    line = ' '.join('a' * 5000 for _ in range(100))
+    report = LoadTest([stand_in], [line], size='fixed:10', requests=2).run()
+    assert report['chars'] > 4 * 1024 * 1024
+    assert report['errors'] == 0
+
+
+def test_loadtest_cli(tmp_path, capsys):
+    from baikalnlpy.__main__ import main
+    corpus = tmp_path / 'corpus.txt'
+    corpus.write_text('오늘은 정말 추운 날이네요.\n반가워요.\n', encoding='utf-8')
+    main(['loadtest', '--corpus', str(corpus), '--stand-in', '--requests', '5', '--size', 'fixed:2'])
+    report = json.loads(capsys.readouterr().out)
+    assert report['requests'] == 5
+
+
+def test_parse_size():
+    import random
+    from baikalnlpy._loadtest import parse_size, percentile
+    assert parse_size('fixed:3')(random.Random()) == 3
+    with pytest.raises(ValueError):
+        parse_size('uniform:3:1')
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 99) == 4.0
@@ -0,0 +1,23 @@
+#!env python3
+# -*- coding: utf-8 -*-
+
+
+def test_client_analyze_syntax_raw(fake_server):
+    import baikalnlpy as bn
+    from baikal.language.language_service_pb2 import AnalyzeSyntaxResponse
+    client = bn.BaikalLanguageServiceClient(f'localhost:{fake_server.port}')
+    raw = client.analyze_syntax_raw('가 나', 'my', True)
+    assert isinstance(raw, bytes)
+    assert AnalyzeSyntaxResponse.FromString(raw) == client.analyze_syntax('가 나', 'my', True)
+    assert fake_server.requests[0].custom_domain == 'my'
+
+
+def test_tagged_lazy_bytes(fake_server):
+    import baikalnlpy as bn
+    tagged = bn.Tagger('localhost', fake_server.port).tag_raw('가 나 다')
+    assert not tagged.parsed()
+    raw = tagged.raw()
+    assert not tagged.parsed()
+    assert tagged.morphs() == ['가', '나', '다']
+    assert tagged.parsed()
+    assert bn.Tagged('가 나 다', tagged.msg()).raw() == raw
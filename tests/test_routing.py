@@ -0,0 +1,129 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import pytest
+
+
+def test_router_owners_are_stable():
+    from baikalnlpy._routing import DomainRouter
+    endpoints = [f'nlp{i}:5656' for i in range(5)]
+    router = DomainRouter(endpoints, replicas=2)
+    domains = [f'domain-{i}' for i in range(200)]
+    before = {d: router.owners(d) for d in domains}
+    assert all(len(o) == 2 for o in before.values())
+    assert before == {d: DomainRouter(list(reversed(endpoints)), 2).owners(d) for d in domains}
+
+    grown = DomainRouter(endpoints + ['nlp5:5656'], replicas=2)
+    for d in domains:
+        moved = set(grown.owners(d)) - set(before[d])
+        assert moved <= {'nlp5:5656'}
+    assert router.owners('') == endpoints
+    with pytest.raises(ValueError):
+        DomainRouter([])
+
+
+def test_router_route_rotates_owners():
+    from baikalnlpy._routing import DomainRouter
+    router = DomainRouter(['a:1', 'b:1', 'c:1'], replicas=2)
+    owners = router.owners('law')
+    firsts = {router.route('law')[0] for _ in range(4)}
+    assert firsts == set(owners)
+    assert len(router.route('law')) == 2
+    router.spill = True
+    assert set(router.route('law')) == {'a:1', 'b:1', 'c:1'}
+
+
+@pytest.fixture
+def servers(fake_server_factory):
+    started = [fake_server_factory() for _ in range(3)]
+    return {f'localhost:{s.port}': s for s in started}
+
+
+def test_tagger_routes_domain_to_owners(servers):
+    import baikalnlpy as bn
+    tagger = bn.Tagger(endpoints=list(servers), replicas=2, domain='law')
+    for _ in range(6):
+        assert tagger.morphs('가 나') == ['가', '나']
+    owners = tagger.router.owners('law')
+    for remote, s in servers.items():
+        if remote in owners:
+            assert len(s.requests) == 3
+        else:
+            assert s.requests == []
+    with pytest.raises(ValueError):
+        bn.Tagger(endpoints=list(servers), channel=object())
+
+
+def test_tagger_fails_over(servers):
+    import baikalnlpy as bn
+    tagger = bn.Tagger(endpoints=list(servers), replicas=2, domain='law')
+    down, up = tagger.router.owners('law')
+    servers[down].server.stop(None)
+    for _ in range(4):
+        assert tagger.morphs('가 나') == ['가', '나']
+    assert len(servers[up].requests) == 4
+
+
+def test_custom_dict_updates_owners(servers):
+    import baikalnlpy as bn
+    tagger = bn.Tagger(endpoints=list(servers), replicas=2)
+    cd = tagger.custom_dict('law')
+    cd.copy_np_set({'근저당권'})
+    assert cd.update()
+    owners = tagger.router.owners('law')
+    for remote, s in servers.items():
+        assert ('law' in s.custom_dict.dicts) == (remote in owners)
+    servers[owners[0]].server.stop(None)
+    assert '근저당권' in cd.get().np_set.items
+
+
+def test_custom_dict_clears_owners(servers):
+    import baikalnlpy as bn
+    tagger = bn.Tagger(endpoints=list(servers), replicas=2)
+    cd = tagger.custom_dict('law')
+    cd.copy_np_set({'근저당권'})
+    cd.update()
+    assert list(cd.clear()) == ['law']
+    assert all(s.custom_dict.dicts == {} for s in servers.values())
+
+
+def test_tagger_spill(servers):
+    import grpc
+    import baikalnlpy as bn
+    strict = bn.Tagger(endpoints=list(servers), replicas=2, domain='law')
+    spill = bn.Tagger(endpoints=list(servers), replicas=2, domain='law', spill=True)
+    assert spill.router.spill and not strict.router.spill
+    for remote in strict.router.owners('law'):
+        servers[remote].server.stop(None)
+    with pytest.raises(grpc.RpcError) as e:
+        strict.morphs('가 나')
+    assert e.value.code() == grpc.StatusCode.UNAVAILABLE
+    assert spill.morphs('가 나') == ['가', '나']
+
+
+class _SlowUnavailable:
+    def __init__(self, timeouts):
+        self.timeouts = timeouts
+
+    def analyze_syntax(self, content, domain, auto_split, timeout=None):
+        import time
+        import grpc
+        from baikalnlpy import ReplayError
+        self.timeouts.append(timeout)
+        time.sleep(0.1)
+        raise ReplayError(grpc.StatusCode.UNAVAILABLE, 'down')
+
+
+def test_tagger_failover_shares_timeout():
+    import grpc
+    import baikalnlpy as bn
+    endpoints = ['a:1', 'b:1', 'c:1']
+    tagger = bn.Tagger(endpoints=endpoints, replicas=2, domain='law', spill=True)
+    timeouts = []
+    for remote in endpoints:
+        tagger.clients[remote] = _SlowUnavailable(timeouts)
+    with pytest.raises(grpc.RpcError):
+        tagger.tag('가', timeout=1.0)
+    assert len(timeouts) == 3
+    assert timeouts[0] <= 1.0
+    assert timeouts[1] <= timeouts[0] - 0.09
+    assert timeouts[2] <= timeouts[1] - 0.09
@@ -0,0 +1,81 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import grpc
+import pytest
+
+
+def test_scheduler_priority_order():
+    import baikalnlpy as bn
+    sched = bn.RequestScheduler({'interactive': 1, 'bulk': 1}, max_concurrency=1)
+    order = []
+    first = sched.acquire('bulk')
+
+    def run(priority, name, deadline=None):
+        with sched.slot(priority, deadline):
+            order.append(name)
+
+    threads = [threading.Thread(target=run, args=('bulk', 'bulk')),
+               threading.Thread(target=run, args=('interactive', 'late', time.monotonic() + 60)),
+               threading.Thread(target=run, args=('interactive', 'soon', time.monotonic() + 30))]
+    for t in threads:
+        t.start()
+        time.sleep(0.05)
+    assert sched.stats()['interactive']['waiting'] == 2
+    sched.release(first)
+    for t in threads:
+        t.join()
+    assert order == ['soon', 'late', 'bulk']
+    stats = sched.stats()
+    assert stats['bulk']['completed'] == 2
+    assert stats['interactive']['mean_wait'] > 0
+
+
+def test_scheduler_deadline_in_queue():
+    import baikalnlpy as bn
+    sched = bn.RequestScheduler(max_concurrency=1)
+    held = sched.acquire()
+    with pytest.raises(bn.QueueTimeout) as e:
+        sched.acquire(deadline=time.monotonic() + 0.05)
+    assert isinstance(e.value, TimeoutError)
+    assert e.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    sched.release(held)
+    assert sched.stats()['interactive']['waiting'] == 0
+    with pytest.raises(ValueError):
+        sched.acquire('unknown')
+
+
+def test_tagger_tags_chunked(fake_server):
+    import baikalnlpy as bn
+    sched = bn.RequestScheduler(chunk_chars=20)
+    tagger = bn.Tagger('localhost', fake_server.port, scheduler=sched)
+    lines = [f'문장 {i} 입니다' for i in range(10)]
+    tagged = tagger.tags(lines, priority='bulk')
+    assert len(fake_server.requests) > 1
+    assert len(tagged.sentences()) == 10
+    assert [tagged.phrase[b:e] for _, _, b, e in tagged.select()] == tagged.morphs()
+    assert sched.stats()['bulk']['completed'] == len(fake_server.requests)
+    assert tagger.pos('가') == [('가', 'NNG')]
+    assert sched.stats()['interactive']['completed'] == 1
+
+
+def test_bulk_tags_queue_timeout(fake_server):
+    import baikalnlpy as bn
+    sched = bn.RequestScheduler({'interactive': 1, 'bulk': 1}, max_concurrency=1)
+    tagger = bn.Tagger('localhost', fake_server.port, scheduler=sched)
+    held = sched.acquire()
+    ctl = bn.AdaptiveBatchController(concurrency=1, timeout=0.05, max_retries=1)
+    with pytest.raises(grpc.RpcError) as e:
+        list(tagger.bulk_tags(['하나', '둘'], controller=ctl))
+    assert e.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert ctl.settings()['failures'] == 2
+
+    # 대기열에서 제한 시간이 지나면 나누어 다시 보내고, 슬롯이 풀리면 끝까지 처리한다.
+    ctl = bn.AdaptiveBatchController(concurrency=1, timeout=0.05, max_retries=20)
+    threading.Timer(0.2, sched.release, args=(held,)).start()
+    results = list(tagger.bulk_tags(['하나', '둘'], controller=ctl))
+    assert '\n'.join(r.phrase for r in results) == '하나\n둘'
+    assert ctl.settings()['failures'] > 0
+    assert fake_server.requests
@@ -0,0 +1,128 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import pytest
+
+
+@pytest.fixture
+def sidecar(fake_server):
+    from baikalnlpy._sidecar import TaggingProxy, serve
+    proxy = TaggingProxy([f'localhost:{fake_server.port}'], pool_size=2)
+    server = serve(proxy, 0, 'localhost', 4)
+    proxy.port = server.bound_port
+    yield proxy
+    server.stop(None)
+
+
+def test_sidecar_cache(fake_server, sidecar):
+    import baikalnlpy as bn
+    a = bn.Tagger('localhost', sidecar.port)
+    b = bn.Tagger('localhost', sidecar.port)
+    assert a.morphs('가 나') == ['가', '나']
+    assert b.morphs('가 나') == ['가', '나']
+    assert b.tag_raw('가 나').raw() == a.tag('가 나').raw()
+    assert len(fake_server.requests) == 1
+    assert sidecar.stats()['hits'] == 3
+    b.set_domain('law')
+    b.morphs('가 나')
+    assert len(fake_server.requests) == 2
+
+
+def test_sidecar_custom_dict_passthrough(fake_server, sidecar):
+    import baikalnlpy as bn
+    tagger = bn.Tagger('localhost', sidecar.port)
+    tagger.morphs('가 나')
+    cd = tagger.custom_dict('my')
+    cd.copy_np_set({'유리왕'})
+    assert cd.update()
+    assert '유리왕' in fake_server.custom_dict.dicts['my'].np_set.items
+    assert len(sidecar.cache) == 0
+    assert '유리왕' in cd.get().np_set.items
+
+
+def test_sidecar_pool_connections(fake_server):
+    from baikalnlpy._sidecar import TaggingProxy
+    from baikalnlpy._lang_service_client import BaikalLanguageServiceClient
+    proxy = TaggingProxy([f'localhost:{fake_server.port}'], pool_size=4)
+    for i in range(8):
+        proxy.analyze_syntax(BaikalLanguageServiceClient.build_request(f'가 {i}').SerializeToString())
+    assert len(fake_server.peers) == 4
+
+
+class _Aborted(Exception):
+    pass
+
+
+class _Context:
+    def __init__(self, remaining):
+        self.remaining = remaining
+        self.code = None
+
+    def time_remaining(self):
+        return self.remaining
+
+    def abort(self, code, details):
+        self.code = code
+        raise _Aborted(details)
+
+
+def test_sidecar_coalesced_deadline():
+    import threading
+    import time
+    import grpc
+    from baikalnlpy._loadtest import start_stand_in
+    from baikalnlpy._sidecar import TaggingProxy, _unary
+    from baikalnlpy._lang_service_client import BaikalLanguageServiceClient
+    upstream = start_stand_in(latency=0.5)
+    try:
+        proxy = TaggingProxy([f'localhost:{upstream.bound_port}'])
+        req = BaikalLanguageServiceClient.build_request('가 나').SerializeToString()
+        first = threading.Thread(target=proxy.analyze_syntax, args=(req,))
+        first.start()
+        while not proxy.misses:
+            time.sleep(0.01)
+        handler = _unary(proxy.analyze_syntax).unary_unary
+        context = _Context(0.05)
+        with pytest.raises(_Aborted):
+            handler(req, context)
+        assert context.code == grpc.StatusCode.DEADLINE_EXCEEDED
+        assert proxy.coalesced == 1
+        first.join()
+    finally:
+        upstream.stop(None)
+
+
+def test_sidecar_upstream_error(fake_server, sidecar):
+    import grpc
+    import baikalnlpy as bn
+    fake_server.fail_codes = [grpc.StatusCode.RESOURCE_EXHAUSTED]
+    with pytest.raises(grpc.RpcError) as e:
+        bn.Tagger('localhost', sidecar.port).tag('가')
+    assert e.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def test_sidecar_large_request(fake_server, sidecar):
+    import baikalnlpy as bn
+    words = ['a' * 5000 + str(i) for i in range(1200)]
+    phrase = ' '.join(words)
+    assert len(phrase.encode('utf-8')) > 4 * 1024 * 1024
+    assert bn.Tagger('localhost', sidecar.port).morphs(phrase) == words
+
+
+def test_sidecar_write_failure_clears_cache(fake_server_factory):
+    import grpc
+    import baikalnlpy as bn
+    from baikalnlpy._sidecar import TaggingProxy, serve
+    up, down = fake_server_factory(), fake_server_factory()
+    down.server.stop(None)
+    proxy = TaggingProxy([f'localhost:{up.port}', f'localhost:{down.port}'], pool_size=1)
+    server = serve(proxy, 0, 'localhost', 4)
+    try:
+        proxy.cache.put(b'request', b'response from the old dictionary')
+        cd = bn.Tagger('localhost', server.bound_port).custom_dict('my')
+        cd.copy_np_set({'유리왕'})
+        with pytest.raises(grpc.RpcError):
+            cd.update()
+        assert 'my' in up.custom_dict.dicts
+        assert len(proxy.cache) == 0
+    finally:
+        server.stop(None)
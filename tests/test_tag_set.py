@@ -0,0 +1,43 @@
+#!env python3
+# -*- coding: utf-8 -*-
+
+
+def test_tagged_select_offsets(offline_tagged, offline_sample1):
+    import baikalnlpy as bn
+    sel = offline_tagged.select(bn.NOUNS | bn.PREDICATES)
+    assert sel == [('오늘', 'NNG', 0, 2), ('춥', 'VA', 7, 8), ('날', 'NNG', 10, 11), ('이', 'VCP', 11, 12)]
+    assert [offline_sample1[b:e] for _, _, b, e in sel] == ['오늘', '추', '날', '이']
+
+
+def test_tagged_offsets_clamped_to_token(offline_contracted):
+    assert offline_contracted.select('EC') == [('아서', 'EC', 1, 2)]
+    assert [(b, e) for _, b, e, _, _ in offline_contracted.token_stream(tags='EC')] == [(1, 2)]
+
+
+def test_tagged_select_by_names(offline_tagged):
+    assert offline_tagged.select(['JX', 'SF'], with_offsets=False) == [('은', 'JX'), ('요', 'JX'), ('.', 'SF')]
+    assert offline_tagged.select('MAG', with_offsets=False) == [('정말', 'MAG')]
+
+
+def test_tagged_pos_on_tables(offline_tagged):
+    assert offline_tagged.pos()[:3] == [('오늘', 'NNG'), ('은', 'JX'), ('정말', 'MAG')]
+    assert offline_tagged.pos(join=True)[-1] == './SF'
+    assert offline_tagged.pos(detail=True)[0][:3] == ('오늘', 'NNG', 'IN_WORD_EMBEDDING')
+    assert offline_tagged.pos(flatten=False)[1] == [('정말', 'MAG')]
+    assert offline_tagged.nouns() == ['오늘', '날']
+    assert offline_tagged.verbs() == []
+    assert len(offline_tagged.morphs()) == 10
+
+
+def test_tagged_token_stream(offline_tagged):
+    stream = list(offline_tagged.token_stream())
+    assert stream[:3] == [('오늘', 0, 2, 1, 'NNG'), ('정말', 4, 6, 2, 'MAG'), ('춥', 7, 8, 1, 'VA')]
+    # '요/JX' 가 빠졌으므로 '.' 의 위치 증가는 2
+    assert stream[-1] == ('.', 14, 15, 2, 'SF')
+
+
+def test_tagged_token_stream_filters(offline_tagged):
+    import baikalnlpy as bn
+    stream = list(offline_tagged.token_stream(tags=bn.NOUNS | bn.PREDICATES, stopwords={'이'}, surface=True))
+    assert stream == [('오늘', 0, 2, 1, 'NNG'), ('추', 7, 8, 3, 'VA'), ('날', 10, 11, 2, 'NNG')]
+    assert len(list(offline_tagged.token_stream(stop_tags=None))) == 10
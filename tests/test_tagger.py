@@ -1,12 +1,44 @@
 #!env python3
 # -*- coding: utf-8 -*-
+import os
+import socket
+
 import pytest
 
+SERVER = ('nlp.baikal.ai', 5656)
+
+
+def _reachable(addr) -> bool:
+    try:
+        socket.create_connection(addr, timeout=3).close()
+        return True
+    except OSError:
+        return False
+
+
+@pytest.fixture(scope='module')
+def channel():
+    """
+    BAIKALNLPY_REPLAY 에 기록 파일을 지정하면 서버 없이 재생하고,
+    BAIKALNLPY_RECORD 에 파일 이름을 지정하면 서버와 주고받은 내용을 기록합니다.
+    둘 다 없고 서버에 닿지 않으면 이 모듈의 시험을 건너뜁니다.
+    """
+    import baikalnlpy as bn
+    if not os.environ.get('BAIKALNLPY_REPLAY') and not _reachable(SERVER):
+        pytest.skip(f'{SERVER[0]}:{SERVER[1]} is not reachable and BAIKALNLPY_REPLAY is not set')
+    if os.environ.get('BAIKALNLPY_REPLAY'):
+        yield bn.ReplayChannel(os.environ['BAIKALNLPY_REPLAY'])
+    elif os.environ.get('BAIKALNLPY_RECORD'):
+        with bn.RecordingChannel(f'{SERVER[0]}:{SERVER[1]}', os.environ['BAIKALNLPY_RECORD']) as ch:
+            yield ch
+    else:
+        yield None
+
 
 @pytest.fixture
-def tagger_instance():
+def tagger_instance(channel):
     import baikalnlpy as bn
-    t = bn.Tagger()
+    t = bn.Tagger(channel=channel)
     return t
 
 
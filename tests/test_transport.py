@@ -0,0 +1,83 @@
+#!env python3
+# -*- coding: utf-8 -*-
+import grpc
+import pytest
+
+
+def test_record_and_replay(fake_server, tmp_path):
+    import baikalnlpy as bn
+    path = str(tmp_path / 'session.bkrr')
+    with bn.RecordingChannel(f'localhost:{fake_server.port}', path) as ch:
+        tagger = bn.Tagger(channel=ch)
+        expected = tagger.pos('오늘은 정말 추운 날이네요.', join=True)
+        raw = tagger.tag_raw('가 나').raw()
+        cd = tagger.custom_dict('my')
+        cd.copy_np_set({'유리왕'})
+        assert cd.update()
+        assert '유리왕' in cd.get().np_set.items
+        assert ch.records == 4
+
+    replay = bn.ReplayChannel(path)
+    assert len(replay) == 4
+    tagger = bn.Tagger('unreachable.invalid', 1, channel=replay)
+    assert tagger.pos('오늘은 정말 추운 날이네요.', join=True) == expected
+    assert tagger.tag_raw('가 나').raw() == raw
+    assert '유리왕' in tagger.custom_dict('my').get().np_set.items
+
+    with pytest.raises(grpc.RpcError) as e:
+        tagger.tag('기록에 없는 문장')
+    assert e.value.code() == grpc.StatusCode.NOT_FOUND
+    assert replay.misses == 1
+
+
+def test_replay_latency(fake_server, tmp_path):
+    import baikalnlpy as bn
+    path = str(tmp_path / 'session.bkrr')
+    with bn.RecordingChannel(f'localhost:{fake_server.port}', path) as ch:
+        bn.Tagger(channel=ch).tag('가')
+    tagger = bn.Tagger(channel=bn.ReplayChannel(path, latency=0.2))
+    with pytest.raises(grpc.RpcError) as e:
+        tagger.tag('가', timeout=0.01)
+    assert e.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    with pytest.raises(ValueError):
+        bn.ReplayChannel(path, latency='slow')
+
+
+def test_replay_bad_file(tmp_path):
+    import baikalnlpy as bn
+    path = tmp_path / 'bad.bkrr'
+    path.write_bytes(b'not a recording')
+    with pytest.raises(ValueError):
+        bn.ReplayChannel(str(path))
+
+
+_RECORD_DICT = '''
+import sys
+import baikalnlpy as bn
+with bn.RecordingChannel(sys.argv[1], sys.argv[2]) as ch:
+    cd = bn.Tagger(channel=ch).custom_dict('my')
+    cd.copy_np_set({'np%d' % i for i in range(50)})
+    cd.copy_cp_set({'cp%d' % i for i in range(50)})
+    assert cd.update()
+'''
+
+_REPLAY_DICT = '''
+import sys
+import baikalnlpy as bn
+cd = bn.Tagger(channel=bn.ReplayChannel(sys.argv[2])).custom_dict('my')
+cd.copy_np_set({'np%d' % i for i in range(50)})
+cd.copy_cp_set({'cp%d' % i for i in range(50)})
+assert cd.update()
+'''
+
+
+def test_replay_across_hash_seeds(fake_server, tmp_path):
+    import os
+    import subprocess
+    import sys
+    path = str(tmp_path / 'dict.bkrr')
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for script, seed in ((_RECORD_DICT, '1'), (_REPLAY_DICT, '2'), (_REPLAY_DICT, '3')):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        subprocess.run([sys.executable, '-c', script, f'localhost:{fake_server.port}', path],
+                       env=env, cwd=root, check=True)